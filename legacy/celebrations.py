@@ -48,9 +48,12 @@ _ASCII_ARTS = [
     ),
 ]
 
+# Private generator so picks never touch the module-level random state.
+_RNG = random.Random()
+
 
 def completion_art() -> str:
     """Return a celebratory ASCII art message for successful runs."""
 
-    return random.choice(_ASCII_ARTS)
+    return _RNG.choice(_ASCII_ARTS)
 
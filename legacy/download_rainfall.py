@@ -18,12 +18,18 @@ import re
 import sys
 import threading
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, List, Tuple
 
 import pandas as pd
 import requests
 
+try:  # Optional: multiplexes concurrent coverage probes over HTTP/2.
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
 # Base URLs used by the helpers below
 NOAA_URL = "https://www.ncdc.noaa.gov/cdo-web/api/v2/data"
 STATION_URL = "https://www.ncdc.noaa.gov/cdo-web/api/v2/stations"
@@ -33,12 +39,37 @@ _CACHE_TTL_SECONDS = 24 * 60 * 60  # 24 hours
 _CACHE_LOCK = threading.RLock()
 _CACHE_DATA: dict[str, dict[str, object]] | None = None
 _ORIGINAL_REQUESTS_GET = requests.get
+_HTTP2_CLIENT = None
+_HTTP2_LOCK = threading.Lock()
 
 
 def _cache_enabled() -> bool:
     return requests.get is _ORIGINAL_REQUESTS_GET
 
 
+def _http2_client():
+    """Return a shared HTTP/2 ``httpx.Client`` or ``None`` when unavailable.
+
+    Requires ``httpx`` with the ``h2`` extra.  ``requests.get`` being patched
+    (as in tests) also disables the client so stubs keep intercepting calls.
+    """
+    global _HTTP2_CLIENT
+    if httpx is None or not _cache_enabled():
+        return None
+    with _HTTP2_LOCK:
+        if _HTTP2_CLIENT is None:
+            try:
+                _HTTP2_CLIENT = httpx.Client(
+                    http2=True,
+                    timeout=20,
+                    limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+                )
+            except ImportError:
+                # ``h2`` is not installed; remember that and stay on requests.
+                _HTTP2_CLIENT = False
+        return _HTTP2_CLIENT or None
+
+
 def _cache_dir() -> Path:
     root = os.environ.get("HH_TOOLS_CACHE_DIR")
     if root:
@@ -135,8 +166,12 @@ def _cache_set(value: object, *parts: object) -> None:
 _ISO_DATE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})")
 
 
+@lru_cache(maxsize=1024)
 def _normalise_iso_date(value: str | None) -> str:
-    """Return ``value`` truncated to ``YYYY-MM-DD`` if possible."""
+    """Return ``value`` truncated to ``YYYY-MM-DD`` if possible.
+
+    Results are memoised; API responses repeat the same handful of dates.
+    """
 
     if not value:
         return ""
@@ -510,6 +545,7 @@ def find_stations_by_city(
     buffer: float = 0.25,
     timeout: int = 30,
     limit: int = 20,
+    session: requests.Session | None = None,
 ) -> list[dict[str, object]]:
     """Locate stations near ``city`` using a simple bounding box search.
 
@@ -522,7 +558,8 @@ def find_stations_by_city(
     station ``id``, ``name``, ``latitude`` and ``longitude`` as well as the
     station's ``mindate``/``maxdate`` range and ``datacoverage`` value.  The
     ``headers`` argument mirrors the historic interface used by the GUI and
-    typically contains the NOAA API token.
+    typically contains the NOAA API token.  ``session`` optionally supplies a
+    :class:`requests.Session` whose pooled connections are reused.
     """
 
     cache_key = ("station_search", city.strip().lower(), round(buffer, 4), int(limit))
@@ -530,12 +567,13 @@ def find_stations_by_city(
     if isinstance(cached, list):
         return [dict(item) for item in cached if isinstance(item, dict)]
 
+    http = session if session is not None else requests
     geo_url = "https://nominatim.openstreetmap.org/search"
     geo_params = {"q": city, "format": "json", "limit": 1}
     # Nominatim requires a custom user agent with contact information
     geo_headers = {"User-Agent": "hh-tools/1.0 (https://example.com)"}
     try:
-        r = requests.get(geo_url, params=geo_params, headers=geo_headers, timeout=timeout)
+        r = http.get(geo_url, params=geo_params, headers=geo_headers, timeout=timeout)
         r.raise_for_status()
     except requests.RequestException:
         return []
@@ -562,7 +600,7 @@ def find_stations_by_city(
         "limit": limit,
         "extent": extent,
     }
-    r = requests.get(STATION_URL, headers=headers, params=params, timeout=timeout)
+    r = http.get(STATION_URL, headers=headers, params=params, timeout=timeout)
     r.raise_for_status()
 
     data = r.json().get("results", [])
@@ -624,7 +662,12 @@ def available_datasets(
 
 
 def available_datatypes(
-    station: str, dataset: str, token: str, *, timeout: int = 30
+    station: str,
+    dataset: str,
+    token: str,
+    *,
+    timeout: int = 30,
+    session: requests.Session | None = None,
 ) -> List[Tuple[str, str]]:
     """Return datatype identifiers and names for ``station`` and ``dataset``.
 
@@ -647,7 +690,8 @@ def available_datatypes(
     headers = {"token": token}
     params = {"stationid": stationid, "datasetid": dataset, "limit": 1000}
     url = "https://www.ncdc.noaa.gov/cdo-web/api/v2/datatypes"
-    r = requests.get(url, headers=headers, params=params, timeout=timeout)
+    http = session if session is not None else requests
+    r = http.get(url, headers=headers, params=params, timeout=timeout)
     r.raise_for_status()
     data = r.json().get("results", [])
     results = [(d["id"], d.get("name", "")) for d in data]
@@ -763,6 +807,7 @@ def station_period_of_record(
     token: str,
     *,
     timeout: int = 30,
+    session: requests.Session | None = None,
 ) -> tuple[str | None, str | None]:
     """Return the period of record for a station within a dataset.
 
@@ -789,6 +834,8 @@ def station_period_of_record(
         NOAA CDO API token.
     timeout: int, optional
         Timeout in seconds for the HTTP request.  Defaults to 30.
+    session: requests.Session, optional
+        Session used for the request so pooled connections are reused.
 
     Returns
     -------
@@ -803,8 +850,9 @@ def station_period_of_record(
         "limit": 1,
     }
     headers = {"token": token}
+    http = session if session is not None else requests
     try:
-        resp = requests.get(STATION_URL, headers=headers, params=params, timeout=timeout)
+        resp = http.get(STATION_URL, headers=headers, params=params, timeout=timeout)
         resp.raise_for_status()
         results = (resp.json() or {}).get("results") or []
         if not results:
@@ -816,6 +864,7 @@ def station_period_of_record(
     except Exception:
         return None, None
 
+
 def available_datatypes_with_extents(
     station: str,
     dataset: str,
@@ -824,10 +873,13 @@ def available_datatypes_with_extents(
     timeout: int = 30,
     dataset_mindate: str | None = None,
     dataset_maxdate: str | None = None,
+    session: requests.Session | None = None,
 ):
     """Return datatype metadata enriched with dataset level date ranges."""
 
-    pairs = available_datatypes(station, dataset, token, timeout=timeout)
+    pairs = available_datatypes(
+        station, dataset, token, timeout=timeout, session=session
+    )
     mindate = _normalise_iso_date(dataset_mindate)
     maxdate = _normalise_iso_date(dataset_maxdate)
     return [
@@ -910,7 +962,15 @@ def has_data_in_range(
     token: str,
     *,
     timeout: int = 20,
+    session: requests.Session | None = None,
+    raise_errors: bool = False,
 ) -> bool:
+    """Return ``True`` if NOAA reports any observation in ``start``–``end``.
+
+    Network and decoding errors are reported as ``False`` unless
+    ``raise_errors`` is set, in which case they propagate so callers can tell
+    a failed lookup from a genuine "no data" answer.
+    """
     stationid = _stationid_with_dataset(station, dataset)
     headers = {"token": token}
     params = {
@@ -921,9 +981,27 @@ def has_data_in_range(
         "enddate": end,
         "limit": 1,
     }
+    # An explicit session carries its own retry/backoff policy (the GUI's
+    # covers 429s from probe fan-out), so HTTP/2 is only used without one.
+    client = _http2_client() if session is None else None
+    if client is not None:
+        try:
+            r = client.get(NOAA_URL, headers=headers, params=params, timeout=timeout)
+            r.raise_for_status()
+        except httpx.HTTPError:
+            if raise_errors:
+                raise
+            return False
+    else:
+        http = session if session is not None else requests
+        try:
+            r = http.get(NOAA_URL, headers=headers, params=params, timeout=timeout)
+            r.raise_for_status()
+        except requests.RequestException:
+            if raise_errors:
+                raise
+            return False
     try:
-        r = requests.get(NOAA_URL, headers=headers, params=params, timeout=timeout)
-        r.raise_for_status()
         res = (r.json() or {}).get("results") or []
         if res:
             return True
@@ -937,11 +1015,17 @@ def has_data_in_range(
                 datatype=datatype,
                 units="in",  # units are irrelevant for a yes/no check
                 timeout=timeout,
+                session=session,
             )
             return not df.empty
         except Exception:
+            if raise_errors:
+                raise
             return False
-    except requests.RequestException:
+    except (requests.RequestException, ValueError):
+        # ValueError covers a malformed JSON body from either client.
+        if raise_errors:
+            raise
         return False
 
 
@@ -957,6 +1041,7 @@ def _fetch_rainfall_ads_fallback(
     datatype: str | None,
     units: str,
     timeout: int,
+    session: requests.Session | None = None,
 ) -> pd.DataFrame:
     """Fetch rainfall using the NCEI Access Data Service (ADS).
 
@@ -984,6 +1069,8 @@ def _fetch_rainfall_ads_fallback(
         ``units`` parameter passed to ADS (``metric`` or ``standard``).
     timeout: int
         Network timeout in seconds.
+    session: requests.Session, optional
+        Session used for the request so pooled connections are reused.
 
     Returns
     -------
@@ -1011,7 +1098,8 @@ def _fetch_rainfall_ads_fallback(
     if datatype:
         params["dataTypes"] = datatype
     ads_url = "https://www.ncei.noaa.gov/access/services/data/v1"
-    resp = requests.get(ads_url, params=params, timeout=timeout)
+    http = session if session is not None else requests
+    resp = http.get(ads_url, params=params, timeout=timeout)
     # On 400/404 simply return an empty DataFrame to signal failure
     try:
         resp.raise_for_status()
@@ -272,15 +272,20 @@ class StationSearchPanel(QtWidgets.QWidget):
         if self._queue_checked_ids:
             self._queue_checked_ids.clear()
             self.queue_selection_changed.emit(0)
-        if self._search_worker:
-            self._search_worker.requestInterruption()
-        worker = StationSearchWorker(city, token, self)
-        worker.result_ready.connect(self._search_completed)
-        worker.error.connect(self._search_error)
-        worker.message.connect(self._relay_search_message)
-        worker.finished.connect(self._search_worker_finished)
+        self.cancel_search()
+        worker = StationSearchWorker(city, token)
+        worker.signals.result_ready.connect(self._search_completed)
+        worker.signals.error.connect(self._search_error)
+        worker.signals.message.connect(self._relay_search_message)
+        worker.signals.finished.connect(self._search_worker_finished)
         self._search_worker = worker
-        worker.start()
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def cancel_search(self) -> None:
+        """Ask any in-flight station search to stop and drop its results."""
+        if self._search_worker:
+            self._search_worker.cancel()
+            self._search_worker = None
 
     # Favourite helpers ------------------------------------------------
     def _is_favorite(self, station_id: str) -> bool:
@@ -603,28 +608,29 @@ class StationSearchPanel(QtWidgets.QWidget):
             years = 0.0
         return coverage >= 0.9 or years >= 10
 
+    def _is_current_search(self) -> bool:
+        worker = self._search_worker
+        return worker is not None and self.sender() is worker.signals
+
     def _relay_search_message(self, text: str) -> None:
-        if self.sender() is not self._search_worker:
+        if not self._is_current_search():
             return
         if text:
             self.message.emit(text)
 
     def _search_error(self, text: str) -> None:
-        if self.sender() is not self._search_worker:
+        if not self._is_current_search():
             return
         self.progress.setVisible(False)
         if text:
             self.message.emit(text)
 
     def _search_worker_finished(self) -> None:
-        worker = self.sender()
-        if worker is self._search_worker:
+        if self._is_current_search():
             self._search_worker = None
-        if isinstance(worker, QtCore.QThread):
-            worker.deleteLater()
 
     def _search_completed(self, stations: List[Dict[str, Any]]):
-        if self.sender() is not self._search_worker:
+        if not self._is_current_search():
             return
         self.progress.setVisible(False)
         valid_stations: list[Dict[str, Any]] = []
@@ -1,28 +1,99 @@
 from __future__ import annotations
 import sys
+import io
+import mmap
 import os
 import re
 import subprocess
-from datetime import datetime, date
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any, List
+from typing import Optional, Tuple, Dict, Any, List, Literal
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 from hh_tools.download_rainfall import (
     available_datasets,
-    has_data_in_range,
     _normalise_iso_date,
 )
 
 from .utils import process_environment, ICON_DIR
 from .search_panel import StationSearchPanel
-from .workers import CoverageProbeWorker, DatatypeFetcher
+from .workers import (
+    CoverageCheck,
+    CoverageCheckSignals,
+    CoverageProbeWorker,
+    DatatypeFetcher,
+    cached_has_data,
+    peek_has_data,
+)
 from .quick_plot import QuickPlotDialog
 
+_ISO_FMT = "%Y-%m-%d"
+_SWMM_FMT = "%Y-%m-%d %H:%M"
+_QT_ISO_FMT = "yyyy-MM-dd"
+_SWMM_RAINFALL_RE = re.compile(
+    rb"^[ \t]*RAINFALL[ \t]+(\S+)[ \t]+(\S+)[ \t]+(\S+)",
+    re.MULTILINE | re.IGNORECASE,
+)
+_STATION_SANITIZE_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+_ARG_FLAGS = (
+    "--station",
+    "--start",
+    "--end",
+    "--api-key",
+    "--output",
+    "--format",
+    "--units",
+    "--source",
+    "--dataset",
+    "--datatype",
+)
+
+
+@dataclass(slots=True)
+class QueueJob:
+    """A single download request, either queued or run directly."""
+
+    station: str
+    station_label: str
+    dataset: str
+    dataset_label: str
+    datatype: str
+    datatype_label: str
+    start: str
+    end: str
+    api: str
+    output: Path
+    format: str
+    units: str
+    source: str
+    source_label: str
+    queue_position: int = 0
+    queue_total: int = 0
+    output_str: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.output_str = str(self.output)
+
+
+def _qdate_to_pydate(value: QtCore.QDate) -> date:
+    """Convert a :class:`QtCore.QDate` to :class:`datetime.date` without string parsing."""
+    return date(value.year(), value.month(), value.day())
+
+
+def _iso_to_pydate(value: str | None) -> date | None:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
+
+
 # Placeholder for completion art
-def completion_art() -> str:
-    return r"""
+_COMPLETION_ART = r"""
        _      _      _
      _( )_  _( )_  _( )_
     (_(%)_)(_(%)_)(_(%)_)
@@ -31,6 +102,10 @@ def completion_art() -> str:
           |       |       |
     """
 
+
+def completion_art() -> str:
+    return _COMPLETION_ART
+
 class DownloadRainfallWindow(QtWidgets.QWidget):
     def __init__(self) -> None:
         super().__init__()
@@ -62,6 +137,10 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
         self._ready_timer = QtCore.QTimer(self)
         self._ready_timer.setSingleShot(True)
         self._ready_timer.timeout.connect(self._set_ready)
+        self._queue_refresh_timer = QtCore.QTimer(self)
+        self._queue_refresh_timer.setSingleShot(True)
+        self._queue_refresh_timer.setInterval(16)
+        self._queue_refresh_timer.timeout.connect(self._do_refresh_queue_view)
 
         # --- Station ---
         self.station_edit = QtWidgets.QLineEdit(self.settings.value("station", ""))
@@ -141,9 +220,21 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
         if sizes:
             self._main_splitter.setSizes(sizes)
 
-        # Default to the previous calendar month after dependent widgets exist so
-        # signal handlers can safely access them during initialization.
-        self._set_last_month()
+        # Restore the last used date range, falling back to the previous
+        # calendar month. Signals stay blocked while restoring so no dataset
+        # refresh or coverage probe fires before the window is shown.
+        saved_start = QtCore.QDate.fromString(
+            str(self.settings.value("start_date", "") or ""), _QT_ISO_FMT
+        )
+        saved_end = QtCore.QDate.fromString(
+            str(self.settings.value("end_date", "") or ""), _QT_ISO_FMT
+        )
+        if saved_start.isValid() and saved_end.isValid():
+            self._set_range(saved_start, saved_end, refresh=False)
+        else:
+            # No dataset refresh here: the combo mirrors and caches it reads
+            # are only set up further down.
+            self._set_range(*self._last_month_range(), refresh=False)
 
         # --- Output ---
         self.output_edit = QtWidgets.QLineEdit(self.settings.value("output_path", ""))
@@ -196,6 +287,15 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
         queue_button_layout.addWidget(self.clear_queue_btn)
         queue_layout.addLayout(queue_button_layout)
 
+        self.queue_coverage_check = QtWidgets.QCheckBox(
+            "Check coverage before each queued download"
+        )
+        self.queue_coverage_check.setToolTip(
+            "Query NOAA for data in the selected range before starting each queued job."
+        )
+        self.queue_coverage_check.setChecked(True)
+        queue_layout.addWidget(self.queue_coverage_check)
+
         self.queue_placeholder = QtWidgets.QLabel(
             "Queue is empty. Use 'Add to Queue' to stage downloads."
         )
@@ -243,11 +343,16 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
         form.addRow(self.progress)
 
         self.output_box = QtWidgets.QPlainTextEdit(readOnly=True)
+        # Bound the log so long queues don't grow the document indefinitely.
+        self.output_box.setMaximumBlockCount(10_000)
         form.addRow(self.output_box)
 
         # Process
+        self._python_exe = sys.executable
+        self._module_prefix = ("-m", "hh_tools.download_rainfall")
         self.process = QtCore.QProcess(self)
         self.process.setProcessEnvironment(process_environment())
+        self.process.setProgram(self._python_exe)
         self.process.readyReadStandardOutput.connect(self._handle_stdout)
         self.process.readyReadStandardError.connect(self._handle_stderr)
         self.process.finished.connect(self._process_finished)
@@ -261,24 +366,66 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
         self.search_panel.queue_selection_changed.connect(
             self._update_queue_selection_hint
         )
-        self.api_edit.textChanged.connect(self.search_panel.set_token)
+        # Only push the token once editing finishes so partially typed keys
+        # don't trigger coverage probes on every keystroke.
+        self.api_edit.editingFinished.connect(
+            lambda: self.search_panel.set_token(self.api_edit.text().strip())
+        )
         self.api_edit.editingFinished.connect(self._refresh_coverage_preview)
         self.search_panel.set_token(self.api_edit.text().strip())
+        # Validated form values are cached until any input widget changes.
+        self._form_values_cache: Optional[Dict[str, Any]] = None
+        self.start_date.dateChanged.connect(self._invalidate_form_cache)
+        self.end_date.dateChanged.connect(self._invalidate_form_cache)
+        self.api_edit.textChanged.connect(self._invalidate_form_cache)
+        self.output_edit.textChanged.connect(self._invalidate_form_cache)
+        for combo in (
+            self.dataset_combo,
+            self.datatype_combo,
+            self.format_combo,
+            self.units_combo,
+            self.source_combo,
+        ):
+            combo.currentIndexChanged.connect(self._invalidate_form_cache)
         self._datatype_fetcher: Optional[DatatypeFetcher] = None
         self._pending_autofill_range: Optional[Tuple[QtCore.QDate, QtCore.QDate]] = None
         self._pending_datatype_id: Optional[str] = None
         self._active_dataset_id: Optional[str] = None
-        self._last_process_error = ""
+        self._dtype_ords_cache: Optional[Tuple[Any, ...]] = None
+        # Combo item id -> row, rebuilt whenever the combos are repopulated.
+        self._dataset_id_to_index: Dict[str, int] = {}
+        self._datatype_id_to_index: Dict[str, int] = {}
+        # Python-side mirrors of the combo rows, so reads never go through
+        # QVariant-wrapped itemData.
+        self._dataset_items: List[Dict[str, Any]] = []
+        self._datatype_items: List[Dict[str, Any]] = []
+        self._last_process_error = io.StringIO()
         self._coverage_worker: Optional[CoverageProbeWorker] = None
         self._coverage_worker_token = 0
-        self._queue: list[Dict[str, Any]] = []
+        self._last_coverage_sig: Optional[Tuple[str, ...]] = None
+        self._queue: deque[QueueJob] = deque()
+        # Queue coverage checks are prefetched in parallel when the queue
+        # starts; the pool is kept small to respect NOAA rate limits.
+        self._coverage_pool = QtCore.QThreadPool(self)
+        self._coverage_pool.setMaxThreadCount(8)
+        self._coverage_check_signals = CoverageCheckSignals(self)
+        self._coverage_check_signals.result.connect(self._coverage_check_done)
+        # Answers live in the shared coverage cache; only in-flight keys,
+        # failures and the job waiting on a result are tracked here.
+        self._coverage_inflight: set[Tuple[str, ...]] = set()
+        self._coverage_errors: Dict[Tuple[str, ...], Exception] = {}
+        self._awaiting_coverage: Optional[Tuple[Tuple[str, ...], QueueJob]] = None
         self._queue_active = False
         self._queue_total = 0
-        self._current_job: Dict[str, Any] | None = None
+        self._current_job: QueueJob | None = None
+        # Output paths claimed by queued/current jobs and the last suffix
+        # counter handed out per requested path, for O(1) uniqueness checks.
+        self._used_outputs: set[str] = set()
+        self._output_counters: Dict[str, int] = {}
 
         self._set_ready()
         self._update_queue_selection_hint(0)
-        self._refresh_queue_view()
+        self._do_refresh_queue_view()
 
     def _set_ready(self) -> None:
         self._ready_timer.stop()
@@ -306,7 +453,7 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
             self.quick_plot_btn.setEnabled(False)
             return
 
-        resolved = Path(path)
+        resolved = path if isinstance(path, Path) else Path(path)
         fmt_text = (fmt or resolved.suffix.lstrip(".")).lower()
         self._last_output_path = resolved
         self._last_output_format = fmt_text
@@ -330,19 +477,18 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
 
     def _cancel_coverage_worker(self) -> None:
         if self._coverage_worker:
-            worker = self._coverage_worker
-            if worker.isRunning():
-                worker.requestInterruption()
-            else:
-                worker.deleteLater()
+            self._coverage_worker.cancel()
             self._coverage_worker = None
             self._coverage_worker_token += 1
+        self._last_coverage_sig = None
+
+    def _coverage_unavailable(self, message: str) -> None:
+        self._cancel_coverage_worker()
+        self.search_panel.show_coverage_message(message)
 
     def _coverage_finished(self) -> None:
-        worker = self.sender()
-        if isinstance(worker, QtCore.QThread):
-            worker.deleteLater()
-        if isinstance(worker, CoverageProbeWorker) and worker is self._coverage_worker:
+        worker = self._coverage_worker
+        if worker is not None and self.sender() is worker.signals:
             self._coverage_worker = None
 
     def _on_coverage_ready(
@@ -355,55 +501,41 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
     def _on_coverage_failed(self, token: int, message: str) -> None:
         if token != self._coverage_worker_token:
             return
+        self._last_coverage_sig = None
         self.search_panel.show_coverage_message(message)
 
     def _refresh_coverage_preview(self) -> None:
-        self._cancel_coverage_worker()
         # Ensure the preview only runs for NOAA datasets where we have an API key.
         if "NOAA" not in self.source_combo.currentText():
-            self.search_panel.show_coverage_message(
+            self._coverage_unavailable(
                 "Coverage preview is only available for NOAA datasets."
             )
             return
         token = self.api_edit.text().strip()
         if not token:
-            self.search_panel.show_coverage_message(
+            self._coverage_unavailable(
                 "Enter your NOAA token to check coverage."
             )
             return
         station = self.station_edit.text().strip()
         if not station:
-            self.search_panel.show_coverage_message(
+            self._coverage_unavailable(
                 "Select a station to preview coverage."
             )
             return
-        data = self.dataset_combo.currentData()
-        dataset = None
-        dataset_info: dict | None = None
-        if isinstance(data, dict):
-            dataset = data.get("id")
-            dataset_info = data
-        elif isinstance(data, str):
-            dataset = data
+        dataset_info = self._current_dataset()
+        dataset = dataset_info.get("id") if dataset_info else None
         if not dataset:
-            self.search_panel.show_coverage_message("Select a dataset to preview coverage.")
+            self._coverage_unavailable("Select a dataset to preview coverage.")
             return
-        dtype = self.datatype_combo.currentData()
+        dtype = self._current_datatype_id()
         if not dtype:
-            self.search_panel.show_coverage_message("Select a datatype to preview coverage.")
+            self._coverage_unavailable("Select a datatype to preview coverage.")
             return
         datatype = str(dtype)
 
-        def _to_date(value: str | None) -> date | None:
-            if not value:
-                return None
-            try:
-                return datetime.strptime(value, "%Y-%m-%d").date()
-            except ValueError:
-                return None
-
-        dataset_start = _to_date(_normalise_iso_date((dataset_info or {}).get("mindate")))
-        dataset_end = _to_date(_normalise_iso_date((dataset_info or {}).get("maxdate")))
+        dataset_start = _iso_to_pydate(_normalise_iso_date((dataset_info or {}).get("mindate")))
+        dataset_end = _iso_to_pydate(_normalise_iso_date((dataset_info or {}).get("maxdate")))
 
         dtype_info: dict | None = None
         if dataset_info:
@@ -413,32 +545,39 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
                 if isinstance(entry, dict) and entry.get("id") == datatype:
                     dtype_info = entry
                     break
-        dtype_start = _to_date(_normalise_iso_date((dtype_info or {}).get("mindate")))
-        dtype_end = _to_date(_normalise_iso_date((dtype_info or {}).get("maxdate")))
+        dtype_start = _iso_to_pydate(_normalise_iso_date((dtype_info or {}).get("mindate")))
+        dtype_end = _iso_to_pydate(_normalise_iso_date((dtype_info or {}).get("maxdate")))
 
         start_date = dtype_start or dataset_start
         end_date = dtype_end or dataset_end
 
-        user_start = _to_date(self.start_date.date().toString("yyyy-MM-dd"))
-        user_end = _to_date(self.end_date.date().toString("yyyy-MM-dd"))
+        user_start = _qdate_to_pydate(self.start_date.date())
+        user_end = _qdate_to_pydate(self.end_date.date())
         if user_start and (not start_date or user_start > start_date):
             start_date = user_start
         if user_end and (not end_date or user_end < end_date):
             end_date = user_end
 
         if not start_date or not end_date:
-            self.search_panel.show_coverage_message(
+            self._coverage_unavailable(
                 "Coverage preview unavailable for this selection."
             )
             return
         if end_date < start_date:
-            self.search_panel.show_coverage_message(
+            self._coverage_unavailable(
                 "Coverage preview unavailable – check the selected dates."
             )
             return
 
-        start = start_date.strftime("%Y-%m-%d")
-        end = end_date.strftime("%Y-%m-%d")
+        start = start_date.strftime(_ISO_FMT)
+        end = end_date.strftime(_ISO_FMT)
+
+        # Combo repopulation and date autofill often re-emit the same
+        # selection; skip respawning the probe when nothing changed.
+        sig = (station, str(dataset), datatype, start, end, token)
+        if sig == self._last_coverage_sig:
+            return
+        self._cancel_coverage_worker()
 
         self.search_panel.show_coverage_loading("Checking coverage history…")
         worker = CoverageProbeWorker(
@@ -448,30 +587,38 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
             token,
             start,
             end,
-            self,
         )
         self._coverage_worker_token += 1
         token_value = self._coverage_worker_token
-        worker.coverage_ready.connect(
+        worker.signals.coverage_ready.connect(
             lambda bins, span, token=token_value: self._on_coverage_ready(
                 token, bins, span
             )
         )
-        worker.failed.connect(
+        worker.signals.failed.connect(
             lambda message, token=token_value: self._on_coverage_failed(token, message)
         )
-        worker.finished.connect(self._coverage_finished)
+        worker.signals.finished.connect(self._coverage_finished)
         self._coverage_worker = worker
-        worker.start()
+        self._last_coverage_sig = sig
+        QtCore.QThreadPool.globalInstance().start(worker)
 
-    def _filter_datatypes_by_date(
-        self, dtypes: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
-        if not dtypes:
-            return []
-        start_q = self.start_date.date()
-        end_q = self.end_date.date()
-        out = []
+    def _datatype_date_ordinals(self, dtypes: List[Dict[str, Any]]):
+        """Return ``(entries, min_ords, max_ords, unknown)`` for ``dtypes``.
+
+        The arrays are cached for the most recent list so repeated date
+        changes only redo the vectorised comparison.
+        """
+        cached = self._dtype_ords_cache
+        if cached is not None and cached[0] is dtypes and cached[1] == len(dtypes):
+            return cached[2:]
+
+        import numpy as np
+
+        entries: List[Dict[str, Any]] = []
+        min_ords: List[int] = []
+        max_ords: List[int] = []
+        unknown: List[bool] = []
         for dt in dtypes:
             if not isinstance(dt, dict):
                 continue
@@ -481,45 +628,74 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
                 dt["mindate"] = mn
             if mx:
                 dt["maxdate"] = mx
-            min_q = StationSearchPanel._to_qdate(mn) if mn else QtCore.QDate()
-            max_q = StationSearchPanel._to_qdate(mx) if mx else QtCore.QDate()
-            if min_q.isValid() and max_q.isValid():
-                ok = (min_q <= end_q) and (max_q >= start_q)
+            min_d = _iso_to_pydate(mn)
+            max_d = _iso_to_pydate(mx)
+            entries.append(dt)
+            if min_d and max_d:
+                min_ords.append(min_d.toordinal())
+                max_ords.append(max_d.toordinal())
+                unknown.append(False)
             else:
-                ok = True
-            if ok:
-                out.append(dt)
-        return out
+                min_ords.append(0)
+                max_ords.append(0)
+                unknown.append(True)
+        result = (
+            entries,
+            np.array(min_ords, dtype=np.int64),
+            np.array(max_ords, dtype=np.int64),
+            np.array(unknown, dtype=bool),
+        )
+        self._dtype_ords_cache = (dtypes, len(dtypes), *result)
+        return result
+
+    def _filter_datatypes_by_date(
+        self, dtypes: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        if not dtypes:
+            return []
+        import numpy as np
+
+        entries, min_ords, max_ords, unknown = self._datatype_date_ordinals(dtypes)
+        start_ord = _qdate_to_pydate(self.start_date.date()).toordinal()
+        end_ord = _qdate_to_pydate(self.end_date.date()).toordinal()
+        mask = unknown | ((min_ords <= end_ord) & (max_ords >= start_ord))
+        return [entries[i] for i in np.flatnonzero(mask)]
 
     # --- Date helpers ---
+    def _set_range(
+        self, start: QtCore.QDate, end: QtCore.QDate, *, refresh: bool = True
+    ) -> None:
+        """Set both date edits while emitting a single dataset refresh."""
+        start_blocked = self.start_date.blockSignals(True)
+        end_blocked = self.end_date.blockSignals(True)
+        try:
+            self.start_date.setDate(start)
+            self.end_date.setDate(end)
+        finally:
+            self.start_date.blockSignals(start_blocked)
+            self.end_date.blockSignals(end_blocked)
+        self._invalidate_form_cache()
+        if refresh:
+            self._dataset_changed()
+
     def _set_yesterday(self):
-        if hasattr(self, "progress"):
-            self.progress.setRange(0, 0)
-            self.progress.setVisible(True)
         d = QtCore.QDate.currentDate().addDays(-1)
-        self.start_date.setDate(d)
-        self.end_date.setDate(d)
+        self._set_range(d, d)
 
     def _set_last_week(self):
-        if hasattr(self, "progress"):
-            self.progress.setRange(0, 0)
-            self.progress.setVisible(True)
         today = QtCore.QDate.currentDate()
         start_this_week = today.addDays(-today.dayOfWeek() + 1)
         start = start_this_week.addDays(-7)
-        self.start_date.setDate(start)
-        self.end_date.setDate(start.addDays(6))
+        self._set_range(start, start.addDays(6))
 
-    def _set_last_month(self):
-        if hasattr(self, "progress"):
-            self.progress.setRange(0, 0)
-            self.progress.setVisible(True)
+    @staticmethod
+    def _last_month_range() -> Tuple[QtCore.QDate, QtCore.QDate]:
         today = QtCore.QDate.currentDate()
         first_this_month = QtCore.QDate(today.year(), today.month(), 1)
-        start = first_this_month.addMonths(-1)
-        end = first_this_month.addDays(-1)
-        self.start_date.setDate(start)
-        self.end_date.setDate(end)
+        return first_this_month.addMonths(-1), first_this_month.addDays(-1)
+
+    def _set_last_month(self):
+        self._set_range(*self._last_month_range())
 
     # --- Run ---
     def _choose_output(self):
@@ -544,7 +720,7 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
     def _show_in_folder(self) -> None:
         if not self._last_output_path:
             return
-        path = Path(self._last_output_path)
+        path = self._last_output_path
         target = path if path.is_dir() else path.parent
         if not target.exists():
             QtWidgets.QMessageBox.warning(
@@ -575,7 +751,7 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
     def _quick_plot(self) -> None:
         if not self._last_output_path:
             return
-        path = Path(self._last_output_path)
+        path = self._last_output_path
         fmt = (self._last_output_format or path.suffix.lstrip(".")).lower()
         if fmt not in {"csv", "tsf", "swmm"}:
             QtWidgets.QMessageBox.information(
@@ -635,25 +811,27 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
         elif fmt == "tsf":
             df = pd.read_csv(path, sep="\t", skiprows=2)
         elif fmt == "swmm":
-            timestamps: list[datetime] = []
-            values: list[float] = []
-            with open(path, "r", encoding="utf-8", errors="ignore") as handle:
-                for line in handle:
-                    line = line.strip()
-                    if not line or line.startswith("["):
-                        continue
-                    parts = line.split()
-                    if len(parts) >= 4 and parts[0].upper() == "RAINFALL":
-                        try:
-                            moment = datetime.strptime(
-                                " ".join(parts[1:3]), "%Y-%m-%d %H:%M"
-                            )
-                            value = float(parts[3])
-                        except ValueError:
-                            continue
-                        timestamps.append(moment)
-                        values.append(value)
-            df = pd.DataFrame({"Datetime": timestamps, "Rainfall": values})
+            stamps: list[str] = []
+            values: list[str] = []
+            with open(path, "rb") as handle:
+                if os.fstat(handle.fileno()).st_size:
+                    # Scan the raw bytes so only RAINFALL rows are decoded.
+                    with mmap.mmap(
+                        handle.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as mm:
+                        for day, clock, value in _SWMM_RAINFALL_RE.findall(mm):
+                            stamps.append((day + b" " + clock).decode("ascii", "ignore"))
+                            values.append(value.decode("ascii", "ignore"))
+            # Parse the collected columns in one pass; SWMM files repeat many
+            # timestamps so ``cache=True`` avoids re-parsing duplicates.
+            df = pd.DataFrame(
+                {
+                    "Datetime": pd.to_datetime(
+                        stamps, format=_SWMM_FMT, errors="coerce", cache=True
+                    ),
+                    "Rainfall": pd.to_numeric(values, errors="coerce"),
+                }
+            )
         else:
             raise ValueError(f"Unsupported format '{fmt}' for quick plot")
 
@@ -689,6 +867,10 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
         self.remove_queue_btn.setEnabled(has_selection and bool(self._queue))
 
     def _refresh_queue_view(self) -> None:
+        # Coalesce bursts of queue changes into a single list rebuild.
+        self._queue_refresh_timer.start()
+
+    def _do_refresh_queue_view(self) -> None:
         has_items = bool(self._queue)
         self.queue_placeholder.setVisible(not has_items)
         self.queue_list.setVisible(has_items)
@@ -705,13 +887,13 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
             self.queue_list.currentRow() >= 0 and bool(self._queue)
         )
 
-    def _format_queue_item(self, position: int, job: Dict[str, Any]) -> str:
-        station = job.get("station_label") or job.get("station")
-        dataset = job.get("dataset_label") or job.get("dataset")
-        datatype = job.get("datatype_label") or job.get("datatype")
-        start = job.get("start")
-        end = job.get("end")
-        output = Path(job.get("output", "")).name
+    def _format_queue_item(self, position: int, job: QueueJob) -> str:
+        station = job.station_label or job.station
+        dataset = job.dataset_label or job.dataset
+        datatype = job.datatype_label or job.datatype
+        start = job.start
+        end = job.end
+        output = job.output.name
         summary = f"{station}"
         if dataset and datatype:
             summary += f" • {dataset}/{datatype}"
@@ -722,38 +904,52 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
         return f"{position}. {summary}"
 
     def _derive_queue_output_path(
-        self, base: Path, fmt: str, station_id: str
+        self,
+        base: Path,
+        base_kind: Literal["dir", "file", "stem"],
+        suffix: str,
+        safe_station: str,
     ) -> Path:
-        safe_station = re.sub(r"[^A-Za-z0-9_.-]+", "_", station_id) or "station"
-        suffix = base.suffix if base.suffix else f".{fmt}"
-        if base.exists() and base.is_dir():
+        """Return the per-station output path without touching the filesystem.
+
+        ``base_kind`` and ``suffix`` are resolved once per batch by
+        :meth:`_classify_queue_output_base`.
+        """
+        if base_kind == "dir":
             return base / f"{safe_station}{suffix}"
+        if base_kind == "file":
+            return base.with_name(f"{base.stem}_{safe_station}{suffix}")
+        return base.parent / f"{base.name}_{safe_station}{suffix}"
+
+    @staticmethod
+    def _classify_queue_output_base(
+        base: Path, fmt: str
+    ) -> Tuple[Path, Literal["dir", "file", "stem"], str]:
+        if base.exists() and base.is_dir():
+            return base, "dir", base.suffix or f".{fmt}"
         if base.suffix:
-            return base.with_name(f"{base.stem}_{safe_station}{base.suffix}")
+            return base, "file", base.suffix
         parent = base.parent if str(base.parent) not in {"", "."} else Path.cwd()
-        stem = base.name or "rainfall"
-        return parent / f"{stem}_{safe_station}{suffix}"
+        return parent / (base.name or "rainfall"), "stem", f".{fmt}"
 
     def _ensure_unique_output(self, path: Path) -> Path:
-        existing = {
-            str(job.get("output"))
-            for job in self._queue
-            if job.get("output") is not None
-        }
-        if self._current_job and self._current_job.get("output"):
-            existing.add(str(self._current_job["output"]))
+        key = str(path)
         candidate = path
-        counter = 1
-        while str(candidate) in existing:
-            candidate = candidate.with_name(
-                f"{candidate.stem}_{counter}{candidate.suffix}"
-            )
+        counter = self._output_counters.get(key, 0)
+        while str(candidate) in self._used_outputs:
             counter += 1
+            candidate = path.with_name(f"{path.stem}_{counter}{path.suffix}")
+        self._output_counters[key] = counter
         return candidate
 
+    def _invalidate_form_cache(self, *_args: Any) -> None:
+        self._form_values_cache = None
+
     def _collect_form_values(self) -> Optional[Dict[str, Any]]:
-        start = self.start_date.date().toString("yyyy-MM-dd")
-        end = self.end_date.date().toString("yyyy-MM-dd")
+        if self._form_values_cache is not None:
+            return dict(self._form_values_cache)
+        start = self.start_date.date().toString(_QT_ISO_FMT)
+        end = self.end_date.date().toString(_QT_ISO_FMT)
         today = QtCore.QDate.currentDate()
         if self.end_date.date() > today:
             QtWidgets.QMessageBox.warning(
@@ -767,10 +963,10 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
                 self, "Missing parameters", "Fill all required fields."
             )
             return None
-        dataset_data = self.dataset_combo.currentData()
-        dataset_id = dataset_data.get("id") if isinstance(dataset_data, dict) else dataset_data
+        dataset_data = self._current_dataset()
+        dataset_id = dataset_data.get("id") if dataset_data else None
         dataset_label = self.dataset_combo.currentText()
-        datatype_id = self.datatype_combo.currentData()
+        datatype_id = self._current_datatype_id()
         datatype_label = self.datatype_combo.currentText()
         if not dataset_id or not datatype_id:
             QtWidgets.QMessageBox.warning(
@@ -784,7 +980,7 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
                 self, "Missing API token", "Enter your NOAA API token."
             )
             return None
-        return {
+        result = {
             "start": start,
             "end": end,
             "api": api,
@@ -798,6 +994,8 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
             "source": source,
             "source_label": source_text,
         }
+        self._form_values_cache = dict(result)
+        return result
 
     def _build_job_payload(
         self,
@@ -806,7 +1004,7 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
         station_label: str | None = None,
         output_path: Path | None = None,
         common_values: Optional[Dict[str, Any]] = None,
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[QueueJob]:
         values = common_values or self._collect_form_values()
         if values is None:
             return None
@@ -816,49 +1014,42 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
                 self, "Missing parameters", "Select a station before proceeding."
             )
             return None
-        output = Path(output_path or values["output"])
-        job = {
-            "station": station,
-            "station_label": station_label or station,
-            "dataset": values["dataset"],
-            "dataset_label": values["dataset_label"],
-            "datatype": values["datatype"],
-            "datatype_label": values["datatype_label"],
-            "start": values["start"],
-            "end": values["end"],
-            "api": values["api"],
-            "output": output,
-            "format": values["format"],
-            "units": values["units"],
-            "source": values["source"],
-            "source_label": values["source_label"],
-        }
-        job["args"] = self._build_process_args(job)
-        return job
-
-    def _build_process_args(self, job: Dict[str, Any]) -> List[str]:
-        return [
-            "--station",
-            job["station"],
-            "--start",
-            job["start"],
-            "--end",
-            job["end"],
-            "--api-key",
-            job["api"],
-            "--output",
-            str(job["output"]),
-            "--format",
-            job["format"],
-            "--units",
-            job["units"],
-            "--source",
-            job["source"],
-            "--dataset",
-            job["dataset"],
-            "--datatype",
-            job["datatype"],
-        ]
+        output = (
+            output_path
+            if isinstance(output_path, Path)
+            else Path(output_path or values["output"])
+        )
+        return QueueJob(
+            station=station,
+            station_label=station_label or station,
+            dataset=values["dataset"],
+            dataset_label=values["dataset_label"],
+            datatype=values["datatype"],
+            datatype_label=values["datatype_label"],
+            start=values["start"],
+            end=values["end"],
+            api=values["api"],
+            output=output,
+            format=values["format"],
+            units=values["units"],
+            source=values["source"],
+            source_label=values["source_label"],
+        )
+
+    def _build_process_args(self, job: QueueJob) -> List[str]:
+        vals = (
+            job.station,
+            job.start,
+            job.end,
+            job.api,
+            job.output_str,
+            job.format,
+            job.units,
+            job.source,
+            job.dataset,
+            job.datatype,
+        )
+        return [x for pair in zip(_ARG_FLAGS, vals) for x in pair]
 
     def _add_selected_to_queue(self) -> None:
         selections = self.search_panel.get_queue_selection()
@@ -872,42 +1063,72 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
         values = self._collect_form_values()
         if values is None:
             return
-        base_output = Path(values["output"])
+        # Resolve everything that is constant across the batch up front so
+        # the per-station loop avoids repeated stat calls and widget reads.
+        base_output, base_kind, suffix = self._classify_queue_output_base(
+            Path(values["output"]), values["format"]
+        )
+        active_dataset = values["dataset"]
+        active_datatype = values["datatype"]
+
+        # Resolve each station's label and dataset/datatype ids once so the
+        # main loop only needs dict/set lookups. ``None`` means no dataset
+        # metadata is known and the station is queued without validation.
+        station_checks: Dict[str, Optional[Tuple[frozenset, frozenset]]] = {}
+        labels: Dict[str, str] = {}
+        for station in selections:
+            sid = str(station.get("id") or "").strip()
+            if not sid or sid in station_checks:
+                continue
+            labels[sid] = self.search_panel.get_station_label(sid)
+            datasets = self.search_panel.get_station_datasets(sid)
+            if not datasets:
+                station_checks[sid] = None
+                continue
+            ids = frozenset(str(d.get("id")) for d in datasets if d.get("id"))
+            matching = next(
+                (d for d in datasets if str(d.get("id")) == active_dataset), None
+            )
+            dtypes: frozenset = frozenset()
+            if matching:
+                dtypes = frozenset(
+                    str(dt.get("id"))
+                    for dt in (
+                        matching.get("filtered_datatypes")
+                        or matching.get("datatypes")
+                        or []
+                    )
+                    if isinstance(dt, dict)
+                )
+            station_checks[sid] = (ids, dtypes)
+
+        # Collect log output and write it once to avoid a text layout pass
+        # per station.
+        log_lines: list[str] = []
         added = 0
         for station in selections:
             sid = str(station.get("id") or "").strip()
             if not sid:
                 continue
-            datasets = self.search_panel.get_station_datasets(sid)
-            if datasets:
-                dataset_ids = {str(d.get("id")) for d in datasets if d.get("id")}
-                if values["dataset"] not in dataset_ids:
-                    self.output_box.appendPlainText(
-                        f"⚠️ Skipping {sid}: dataset {values['dataset']} not available."
+            checks = station_checks[sid]
+            if checks is not None:
+                ids, dtypes = checks
+                if active_dataset not in ids:
+                    log_lines.append(
+                        f"⚠️ Skipping {sid}: dataset {active_dataset} not available."
                     )
                     continue
-                matching_dataset = next(
-                    (d for d in datasets if str(d.get("id")) == values["dataset"]),
-                    None,
-                )
-                if matching_dataset:
-                    datatypes = [
-                        str(dt.get("id"))
-                        for dt in (
-                            matching_dataset.get("filtered_datatypes")
-                            or matching_dataset.get("datatypes")
-                            or []
-                        )
-                        if isinstance(dt, dict)
-                    ]
-                    if datatypes and values["datatype"] not in datatypes:
-                        self.output_box.appendPlainText(
-                            f"⚠️ Skipping {sid}: datatype {values['datatype']} not available."
-                        )
-                        continue
-            output_path = self._derive_queue_output_path(base_output, values["format"], sid)
+                if dtypes and active_datatype not in dtypes:
+                    log_lines.append(
+                        f"⚠️ Skipping {sid}: datatype {active_datatype} not available."
+                    )
+                    continue
+            safe_station = _STATION_SANITIZE_RE.sub("_", sid) or "station"
+            output_path = self._derive_queue_output_path(
+                base_output, base_kind, suffix, safe_station
+            )
             output_path = self._ensure_unique_output(output_path)
-            label = self.search_panel.get_station_label(sid)
+            label = labels[sid]
             job = self._build_job_payload(
                 sid,
                 station_label=label,
@@ -917,10 +1138,17 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
             if not job:
                 continue
             self._queue.append(job)
+            self._used_outputs.add(job.output_str)
             added += 1
-            self.output_box.appendPlainText(
-                f"➕ Added {label} ({values['dataset']}/{values['datatype']}) to the queue → {output_path.name}"
+            log_lines.append(
+                f"➕ Added {label} ({active_dataset}/{active_datatype}) to the queue → {output_path.name}"
             )
+        if log_lines:
+            self.output_box.setUpdatesEnabled(False)
+            try:
+                self.output_box.appendPlainText("\n".join(log_lines))
+            finally:
+                self.output_box.setUpdatesEnabled(True)
         if added:
             if self._queue_active:
                 self._queue_total += added
@@ -943,6 +1171,7 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
             return
         self._queue_active = True
         self._queue_total = len(self._queue)
+        self._prefetch_queue_coverage()
         self.run_btn.setEnabled(False)
         self.start_queue_btn.setEnabled(False)
         self.output_box.appendPlainText(
@@ -951,49 +1180,117 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
         self._set_status("Starting batch downloads…", timeout=0)
         self._start_next_job()
 
+    @staticmethod
+    def _coverage_key(job: QueueJob) -> Tuple[str, ...]:
+        return (
+            job.station,
+            job.dataset,
+            job.datatype,
+            job.start,
+            job.end,
+            job.api,
+        )
+
+    def _submit_coverage_check(self, key: Tuple[str, ...]) -> None:
+        if key in self._coverage_inflight:
+            return
+        self._coverage_inflight.add(key)
+        self._coverage_pool.start(
+            CoverageCheck(*key, signals=self._coverage_check_signals)
+        )
+
+    def _prefetch_queue_coverage(self) -> None:
+        self._coverage_errors.clear()
+        if not self.queue_coverage_check.isChecked():
+            return
+        for job in self._queue:
+            if job.source != "noaa":
+                continue
+            key = self._coverage_key(job)
+            if peek_has_data(*key) is None:
+                self._submit_coverage_check(key)
+
+    def _coverage_check_done(self, key: tuple, outcome: object) -> None:
+        self._coverage_inflight.discard(key)
+        if isinstance(outcome, Exception):
+            self._coverage_errors[key] = outcome
+        awaiting = self._awaiting_coverage
+        if awaiting is None or awaiting[0] != key:
+            return
+        self._awaiting_coverage = None
+        job = awaiting[1]
+        # _launch_job claims the path again if the job starts or waits.
+        self._used_outputs.discard(job.output_str)
+        if self._queue_active and not self._launch_job(job, from_queue=True):
+            self._start_next_job()
+
     def _start_next_job(self) -> None:
         while self._queue:
-            job = self._queue.pop(0)
+            job = self._queue.popleft()
+            self._used_outputs.discard(job.output_str)
             position = max(1, self._queue_total - len(self._queue))
-            job["queue_position"] = position
-            job["queue_total"] = max(self._queue_total, position + len(self._queue))
+            job.queue_position = position
+            job.queue_total = max(self._queue_total, position + len(self._queue))
             self._refresh_queue_view()
             if self._launch_job(job, from_queue=True):
                 return
-        # Queue exhausted
+        self._finish_queue()
+
+    def _finish_queue(self) -> None:
         self._queue_active = False
         self._queue_total = 0
+        if self._current_job is not None:
+            self._used_outputs.discard(self._current_job.output_str)
         self._current_job = None
         self.run_btn.setEnabled(True)
         self.start_queue_btn.setEnabled(bool(self._queue))
         self.cancel_btn.setEnabled(False)
         self.progress.setVisible(False)
+        self._queue_refresh_timer.stop()
+        self._do_refresh_queue_view()
         if not self._queue:
             self._set_status("Queue complete.", timeout=6000)
-        self._refresh_queue_view()
 
-    def _launch_job(self, job: Dict[str, Any], *, from_queue: bool) -> bool:
-        station_label = job.get("station_label") or job.get("station")
+    def _launch_job(self, job: QueueJob, *, from_queue: bool) -> bool:
+        station_label = job.station_label or job.station
         prefix = ""
         if from_queue:
             prefix = (
-                f"Queue {job.get('queue_position', 1)}/{job.get('queue_total', 1)} – "
+                f"Queue {job.queue_position or 1}/{job.queue_total or 1} – "
             )
-        if job.get("source") == "noaa":
-            try:
-                has_data = has_data_in_range(
-                    job["station"],
-                    job["dataset"],
-                    job["datatype"],
-                    job["start"],
-                    job["end"],
-                    job["api"],
-                )
-            except Exception as exc:
+        check_coverage = not from_queue or self.queue_coverage_check.isChecked()
+        if job.source == "noaa" and check_coverage:
+            key = self._coverage_key(job)
+            outcome: object
+            if from_queue:
+                outcome = peek_has_data(*key)
+                if outcome is None:
+                    outcome = self._coverage_errors.pop(key, None)
+                if outcome is None:
+                    # Still in flight: _coverage_check_done resumes this job.
+                    # Its output path stays reserved while it waits.
+                    self._submit_coverage_check(key)
+                    self._awaiting_coverage = (key, job)
+                    self._used_outputs.add(job.output_str)
+                    self._set_status(
+                        f"{prefix}Checking data coverage for {station_label}…",
+                        timeout=0,
+                    )
+                    self.progress.setVisible(True)
+                    self.cancel_btn.setEnabled(True)
+                    return True
+            else:
+                try:
+                    outcome = cached_has_data(*key)
+                except Exception as exc:
+                    outcome = exc
+            if isinstance(outcome, Exception):
                 has_data = True
                 self.output_box.appendPlainText(
-                    f"⚠️ Coverage check failed (continuing download): {exc}"
+                    f"⚠️ Coverage check failed (continuing download): {outcome}"
                 )
+            else:
+                has_data = bool(outcome)
             if not has_data:
                 warning = (
                     "⚠️ Warning: No data points were found for the selected range."
@@ -1014,7 +1311,7 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
                     if response == QtWidgets.QMessageBox.No:
                         self._set_status("Download cancelled before start.", timeout=6000)
                         return False
-        output_path: Path = job["output"]
+        output_path = job.output
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
         except Exception as exc:
@@ -1030,27 +1327,32 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
             return False
         self._set_post_download_actions(None, None)
         self._pending_output_path = output_path
-        self._pending_output_format = job["format"]
+        self._pending_output_format = job.format
+        if self._current_job is not None:
+            self._used_outputs.discard(self._current_job.output_str)
         self._current_job = job
-        self._last_process_error = ""
+        self._used_outputs.add(job.output_str)
+        self._last_process_error = io.StringIO()
         message = (
             f"{prefix}Fetching rainfall data for {station_label} "
-            f"({job['start']} → {job['end']}) → {output_path.name}"
+            f"({job.start} → {job.end}) → {output_path.name}"
         )
         self.output_box.appendPlainText(message)
         self._set_status(message, timeout=0)
         self.run_btn.setEnabled(False)
         self.progress.setVisible(True)
         self.cancel_btn.setEnabled(True)
-        self.process.start(
-            sys.executable, ["-m", "hh_tools.download_rainfall", *job["args"]]
-        )
+        self.process.setArguments([*self._module_prefix, *self._build_process_args(job)])
+        self.process.start()
         return True
 
     def _clear_queue(self) -> None:
         if not self._queue:
             return
+        for job in self._queue:
+            self._used_outputs.discard(job.output_str)
         self._queue.clear()
+        self._output_counters.clear()
         self._refresh_queue_view()
         if not self._queue_active:
             self.start_queue_btn.setEnabled(False)
@@ -1059,8 +1361,10 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
         row = self.queue_list.currentRow()
         if row < 0 or row >= len(self._queue):
             return
-        job = self._queue.pop(row)
-        label = job.get("station_label") or job.get("station")
+        job = self._queue[row]
+        del self._queue[row]
+        self._used_outputs.discard(job.output_str)
+        label = job.station_label or job.station
         self.output_box.appendPlainText(f"➖ Removed {label} from the queue.")
         self._refresh_queue_view()
 
@@ -1103,21 +1407,23 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
             return
         self._populate_dataset_combo(datasets)
 
+    def _current_dataset(self) -> Optional[Dict[str, Any]]:
+        idx = self.dataset_combo.currentIndex()
+        if 0 <= idx < len(self._dataset_items):
+            return self._dataset_items[idx]
+        return None
+
+    def _current_datatype_id(self) -> Optional[str]:
+        idx = self.datatype_combo.currentIndex()
+        if 0 <= idx < len(self._datatype_items):
+            return self._datatype_items[idx]["id"]
+        return None
+
     def _find_dataset_index(self, dataset_id: str) -> int:
-        for i in range(self.dataset_combo.count()):
-            data = self.dataset_combo.itemData(i)
-            if isinstance(data, dict) and data.get("id") == dataset_id:
-                return i
-            if isinstance(data, str) and data == dataset_id:
-                return i
-        return -1
+        return self._dataset_id_to_index.get(dataset_id, -1)
 
     def _find_datatype_index(self, datatype_id: str) -> int:
-        for i in range(self.datatype_combo.count()):
-            data = self.datatype_combo.itemData(i)
-            if isinstance(data, str) and data == datatype_id:
-                return i
-        return -1
+        return self._datatype_id_to_index.get(datatype_id, -1)
 
     def _select_datatype_by_id(self, datatype_id: str) -> None:
         idx = self._find_datatype_index(datatype_id)
@@ -1162,18 +1468,23 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
             self._pending_autofill_range = None
 
     def _populate_dataset_combo(self, datasets: List[Dict[str, Any]]) -> None:
-        current_id = None
-        curr_data = self.dataset_combo.currentData()
-        if isinstance(curr_data, dict):
-            current_id = curr_data.get("id")
-        elif isinstance(curr_data, str):
-            current_id = curr_data
-        self.dataset_combo.blockSignals(True)
-        self.dataset_combo.clear()
-        for d in datasets:
-            label = f"{d['id']} - {d.get('name','')}" if d.get("name") else d["id"]
-            self.dataset_combo.addItem(label, d)
-        self.dataset_combo.blockSignals(False)
+        curr_data = self._current_dataset()
+        current_id = curr_data.get("id") if curr_data else None
+        labels = [
+            f"{d['id']} - {d.get('name','')}" if d.get("name") else d["id"]
+            for d in datasets
+        ]
+        self._dataset_id_to_index = {}
+        self._dataset_items = list(datasets)
+        with QtCore.QSignalBlocker(self.dataset_combo):
+            self.dataset_combo.clear()
+            # addItems inserts all rows in one model operation; user data is
+            # attached afterwards.
+            self.dataset_combo.addItems(labels)
+            for i, d in enumerate(datasets):
+                self.dataset_combo.setItemData(i, d)
+                self._dataset_id_to_index.setdefault(d["id"], i)
+        self._invalidate_form_cache()
         if current_id:
             idx = self._find_dataset_index(current_id)
             if idx >= 0:
@@ -1183,16 +1494,18 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
         self._dataset_changed()
 
     def _dataset_changed(self) -> None:
-        data = self.dataset_combo.currentData()
+        data = self._current_dataset()
         if not data:
             self.datatype_combo.clear()
+            self._datatype_id_to_index = {}
+            self._datatype_items = []
             return
-        dataset_id = data.get("id") if isinstance(data, dict) else data
+        dataset_id = data.get("id")
         if dataset_id != self._active_dataset_id:
             self._active_dataset_id = dataset_id
-            self._populate_datatypes(dataset_id, data if isinstance(data, dict) else {})
+            self._populate_datatypes(dataset_id, data)
         else:
-            self._apply_datatypes(data if isinstance(data, dict) else {})
+            self._apply_datatypes(data)
         self._refresh_coverage_preview()
 
     def _populate_datatypes(self, dataset_id: str, dataset_obj: Dict[str, Any]) -> None:
@@ -1206,10 +1519,10 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
             self._apply_datatypes(dataset_obj)
             return
         if self._datatype_fetcher:
-            if self._datatype_fetcher.isRunning():
-                return
-            self._datatype_fetcher = None
+            return
         self.datatype_combo.clear()
+        self._datatype_id_to_index = {}
+        self._datatype_items = []
         self.datatype_combo.addItem("Loading datatypes...", None)
         self.datatype_combo.setEnabled(False)
         self._set_status(f"Fetching datatypes for {dataset_id}...")
@@ -1219,13 +1532,12 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
             token,
             dataset_mindate=dataset_obj.get("mindate"),
             dataset_maxdate=dataset_obj.get("maxdate"),
-            parent=self,
         )
-        fetcher.datatypes_ready.connect(self._datatypes_ready)
-        fetcher.error.connect(self._datatypes_error)
-        fetcher.finished.connect(self._datatype_fetch_finished)
+        fetcher.signals.datatypes_ready.connect(self._datatypes_ready)
+        fetcher.signals.error.connect(self._datatypes_error)
+        fetcher.signals.finished.connect(self._datatype_fetch_finished)
         self._datatype_fetcher = fetcher
-        fetcher.start()
+        QtCore.QThreadPool.globalInstance().start(fetcher)
 
     def _datatype_fetch_finished(self) -> None:
         self.datatype_combo.setEnabled(True)
@@ -1236,8 +1548,8 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
         self, station: str, dataset: str, datatypes: List[Dict[str, Any]]
     ) -> None:
         self.search_panel.update_station_datatypes(station, dataset, datatypes)
-        current_data = self.dataset_combo.currentData()
-        if isinstance(current_data, dict) and current_data.get("id") == dataset:
+        current_data = self._current_dataset()
+        if current_data is not None and current_data.get("id") == dataset:
             self._apply_datatypes(current_data)
 
     def _datatypes_error(self, station: str, dataset: str, error: str) -> None:
@@ -1245,10 +1557,12 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
             f"⚠️ Failed to fetch datatypes for {dataset}: {error}"
         )
         self.datatype_combo.clear()
+        self._datatype_id_to_index = {}
+        self._datatype_items = []
         self.datatype_combo.addItem("Error loading datatypes", None)
 
     def _apply_datatypes(self, dataset_obj: Dict[str, Any]) -> None:
-        current_dt_id = self.datatype_combo.currentData()
+        current_dt_id = self._current_datatype_id()
         if self._pending_datatype_id:
             current_dt_id = self._pending_datatype_id
             self._pending_datatype_id = None
@@ -1260,22 +1574,28 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
             all_datatypes,
             filtered=filtered,
         )
-        self.datatype_combo.blockSignals(True)
-        self.datatype_combo.clear()
-        if not filtered:
-            if all_datatypes:
-                self.datatype_combo.addItem(
-                    "(No datatypes in date range)", None
-                )
+        self._datatype_id_to_index = {}
+        self._datatype_items = []
+        with QtCore.QSignalBlocker(self.datatype_combo):
+            self.datatype_combo.clear()
+            if not filtered:
+                if all_datatypes:
+                    self.datatype_combo.addItem(
+                        "(No datatypes in date range)", None
+                    )
+                else:
+                    self.datatype_combo.addItem("(No datatypes available)", None)
             else:
-                self.datatype_combo.addItem("(No datatypes available)", None)
-        else:
-            for dt in filtered:
-                label = (
+                labels = [
                     f"{dt['id']} - {dt.get('name','')}" if dt.get("name") else dt["id"]
-                )
-                self.datatype_combo.addItem(label, dt["id"])
-        self.datatype_combo.blockSignals(False)
+                    for dt in filtered
+                ]
+                self.datatype_combo.addItems(labels)
+                self._datatype_items = list(filtered)
+                for i, dt in enumerate(filtered):
+                    self.datatype_combo.setItemData(i, dt["id"])
+                    self._datatype_id_to_index.setdefault(dt["id"], i)
+        self._invalidate_form_cache()
         if current_dt_id:
             self._select_datatype_by_id(str(current_dt_id))
         if self.datatype_combo.currentIndex() < 0 and self.datatype_combo.count() > 0:
@@ -1289,18 +1609,23 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
         else:
             self.dataset_combo.clear()
             self.datatype_combo.clear()
+            self._dataset_id_to_index = {}
+            self._dataset_items = []
+            self._datatype_id_to_index = {}
+            self._datatype_items = []
 
     def _handle_stdout(self) -> None:
         data = self.process.readAllStandardOutput()
-        text = bytes(data).decode("utf-8", errors="replace").strip()
+        text = data.data().decode("utf-8", errors="replace").rstrip("\r\n")
         if text:
             self.output_box.appendPlainText(text)
 
     def _handle_stderr(self) -> None:
         data = self.process.readAllStandardError()
-        text = bytes(data).decode("utf-8", errors="replace").strip()
+        text = data.data().decode("utf-8", errors="replace").rstrip("\r\n")
         if text:
-            self._last_process_error += text + "\n"
+            self._last_process_error.write(text)
+            self._last_process_error.write("\n")
             self.output_box.appendPlainText(f"STDERR: {text}")
 
     def _process_finished(self, exit_code: int, _exit_status: int) -> None:
@@ -1332,24 +1657,26 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
                 QtWidgets.QMessageBox.critical(
                     self,
                     "Download Failed",
-                    f"The download process exited with code {exit_code}.\n\nError output:\n{self._last_process_error.strip()}",
+                    f"The download process exited with code {exit_code}.\n\nError output:\n{self._last_process_error.getvalue().strip()}",
                 )
 
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         if self.process.state() != QtCore.QProcess.NotRunning:
             self.process.kill()
-        if self._search_worker and self._search_worker.isRunning():
-            self._search_worker.requestInterruption()
-            self._search_worker.wait(1000)
-        if self._coverage_worker and self._coverage_worker.isRunning():
-            self._coverage_worker.requestInterruption()
-            self._coverage_worker.wait(1000)
-        if self._datatype_fetcher and self._datatype_fetcher.isRunning():
-            self._datatype_fetcher.quit()
-            self._datatype_fetcher.wait(1000)
+        self.search_panel.cancel_search()
+        if self._coverage_worker:
+            self._coverage_worker.cancel()
+        self._coverage_pool.clear()
+        if self._datatype_fetcher:
+            self._datatype_fetcher.cancel()
+        QtCore.QThreadPool.globalInstance().waitForDone(1000)
         self.search_panel.save_layout_state()
         self.settings.setValue("geometry", self.saveGeometry())
         self.settings.setValue("main_splitter_sizes", self._main_splitter.sizes())
+        self.settings.setValue(
+            "start_date", self.start_date.date().toString(_QT_ISO_FMT)
+        )
+        self.settings.setValue("end_date", self.end_date.date().toString(_QT_ISO_FMT))
         event.accept()
 
     def _cancel(self) -> None:
@@ -1360,6 +1687,15 @@ class DownloadRainfallWindow(QtWidgets.QWidget):
         if self._queue_active:
             self._queue_active = False
             self.output_box.appendPlainText("⏹ Queue stopped by user.")
+            if self._awaiting_coverage is not None:
+                # The job never started; put it back at the front. Its
+                # output path is still reserved, now by the queue.
+                _key, job = self._awaiting_coverage
+                self._awaiting_coverage = None
+                self._queue.appendleft(job)
+                self._set_status("Cancelled.", timeout=5000)
+                self._finish_queue()
+                return
             self._refresh_queue_view()
 
     def _show_help(self) -> None:
@@ -1,7 +1,16 @@
 from __future__ import annotations
-from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import Callable, Optional, List, Dict, Any, Tuple
+import requests
 from PyQt5 import QtCore
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from hh_tools.download_rainfall import (
     available_datatypes_with_extents,
@@ -11,11 +20,168 @@ from hh_tools.download_rainfall import (
     station_period_of_record,
 )
 
-class CoverageProbeWorker(QtCore.QThread):
-    """Check whether data exists for yearly/decadal bins in the background."""
+# Datatype extents earlier than this are treated as placeholders.
+_EARLY_THRESHOLD = "1800-01-01"
+
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _shared_session() -> requests.Session:
+    """Return the process-wide session used by the background workers."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=32,
+                # Rate-limit and gateway errors are retried (honouring
+                # Retry-After) before they surface to the caller.
+                max_retries=Retry(
+                    total=2,
+                    backoff_factor=0.2,
+                    status_forcelist=(429, 502, 503, 504),
+                ),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSION = session
+        return _SESSION
+
+
+def _year(value: str) -> int:
+    """Return the year of a ``YYYY-MM-DD`` string without a full date parse."""
+    if not _ISO_DATE_RE.fullmatch(value):
+        raise ValueError(f"invalid ISO date: {value!r}")
+    return int(value[:4])
+
+
+# Coverage answers are reused for a while, then re-checked: NOAA keeps
+# publishing recent data, so a "no data" answer can go stale.
+_HAS_DATA_TTL = 30 * 60.0
+_HAS_DATA_MAX_ENTRIES = 4096
+_HAS_DATA_CACHE: "OrderedDict[Tuple[str, ...], Tuple[float, bool]]" = OrderedDict()
+_HAS_DATA_LOCK = threading.Lock()
+
+
+def _has_data_key(
+    station: str, dataset: str, datatype: str, start: str, end: str, token: str
+) -> Tuple[str, ...]:
+    # Keyed by a digest so the cache never holds the API token itself.
+    digest = hashlib.blake2b(token.encode(), digest_size=8).hexdigest()
+    return (station, dataset, datatype, start, end, digest)
+
+
+def _peek(key: Tuple[str, ...]) -> bool | None:
+    with _HAS_DATA_LOCK:
+        entry = _HAS_DATA_CACHE.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= time.monotonic():
+            del _HAS_DATA_CACHE[key]
+            return None
+        _HAS_DATA_CACHE.move_to_end(key)
+        return value
+
+
+def peek_has_data(
+    station: str, dataset: str, datatype: str, start: str, end: str, token: str
+) -> bool | None:
+    """Return a cached coverage answer, or ``None`` without touching the network."""
+    return _peek(_has_data_key(station, dataset, datatype, start, end, token))
+
+
+def cached_has_data(
+    station: str,
+    dataset: str,
+    datatype: str,
+    start: str,
+    end: str,
+    token: str,
+    *,
+    session: requests.Session | None = None,
+) -> bool:
+    """:func:`has_data_in_range` with answers cached for ``_HAS_DATA_TTL`` seconds.
+
+    Network and decoding errors propagate and are not cached.  Lookups go
+    through ``session``, or the shared worker session when it is omitted.
+    """
+    key = _has_data_key(station, dataset, datatype, start, end, token)
+    cached = _peek(key)
+    if cached is not None:
+        return cached
+    value = bool(
+        has_data_in_range(
+            station,
+            dataset,
+            datatype,
+            start,
+            end,
+            token,
+            session=session if session is not None else _shared_session(),
+            raise_errors=True,
+        )
+    )
+    with _HAS_DATA_LOCK:
+        _HAS_DATA_CACHE[key] = (time.monotonic() + _HAS_DATA_TTL, value)
+        _HAS_DATA_CACHE.move_to_end(key)
+        while len(_HAS_DATA_CACHE) > _HAS_DATA_MAX_ENTRIES:
+            _HAS_DATA_CACHE.popitem(last=False)
+    return value
 
+
+class _CancellableRunnable(QtCore.QRunnable):
+    """:class:`QtCore.QRunnable` that emits ``signals.finished`` and can be cancelled.
+
+    Subclasses pass the callable doing the work to the constructor.
+    Runnables cannot emit signals themselves, so each subclass assigns a
+    ``QObject`` signal holder to ``self.signals``.  Cancellation goes through a
+    :class:`threading.Event` which may be shared between several runnables.
+    """
+
+    signals: QtCore.QObject
+
+    def __init__(
+        self, work: Callable[[], None], cancel_event: threading.Event | None = None
+    ) -> None:
+        super().__init__()
+        self._work = work
+        # The pool takes ownership on start(); callers only touch the
+        # Python-side ``signals`` and ``cancel()`` afterwards.
+        self._cancel_event = cancel_event or threading.Event()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def _wait_for(self, future: Future, poll: float = 0.1) -> bool:
+        """Block until ``future`` completes; return ``False`` if cancelled first."""
+        while not wait((future,), timeout=poll).done:
+            if self.is_cancelled():
+                return False
+        return not self.is_cancelled()
+
+    def run(self) -> None:
+        try:
+            self._work()
+        finally:
+            self.signals.finished.emit()
+
+
+class CoverageProbeSignals(QtCore.QObject):
     coverage_ready = QtCore.pyqtSignal(list, int)
     failed = QtCore.pyqtSignal(str)
+    finished = QtCore.pyqtSignal()
+
+
+class CoverageProbeWorker(_CancellableRunnable):
+    """Check whether data exists for yearly/decadal bins in the background."""
 
     def __init__(
         self,
@@ -25,15 +191,18 @@ class CoverageProbeWorker(QtCore.QThread):
         token: str,
         start: str,
         end: str,
-        parent: QtCore.QObject | None = None,
+        session: requests.Session | None = None,
+        cancel_event: threading.Event | None = None,
     ) -> None:
-        super().__init__(parent)
+        super().__init__(self._run, cancel_event)
+        self.signals = CoverageProbeSignals()
         self._station = station
         self._dataset = dataset
         self._datatype = datatype
         self._token = token
         self._start = start
         self._end = end
+        self._session = session
 
     @staticmethod
     def _build_bins(start_year: int, end_year: int) -> tuple[list[tuple[str, int, int]], int]:
@@ -44,105 +213,168 @@ class CoverageProbeWorker(QtCore.QThread):
             step = 5
         else:
             step = 10
-        bins: list[tuple[str, int, int]] = []
-        year = start_year - (start_year % step)
-        while year <= end_year:
-            bin_start = max(start_year, year)
-            bin_end = min(end_year, year + step - 1)
-            if step == 1 or bin_start == bin_end:
-                label = str(bin_start)
-            else:
-                label = f"{bin_start}–{bin_end}"
-            bins.append((label, bin_start, bin_end))
-            year += step
+        if step == 1:
+            return [(str(year), year, year) for year in range(start_year, end_year + 1)], step
+        spans = [
+            (max(start_year, year), min(end_year, year + step - 1))
+            for year in range(start_year - (start_year % step), end_year + 1, step)
+        ]
+        bins = [
+            (str(lo) if lo == hi else f"{lo}–{hi}", lo, hi)
+            for lo, hi in spans
+        ]
         return bins, step
 
-    def run(self) -> None:
+    def _run(self) -> None:
         try:
-            start_year = datetime.strptime(self._start, "%Y-%m-%d").year
-            end_year = datetime.strptime(self._end, "%Y-%m-%d").year
+            start_year = _year(self._start)
+            end_year = _year(self._end)
         except ValueError:
-            self.failed.emit("Coverage preview unavailable – invalid date range.")
+            self.signals.failed.emit("Coverage preview unavailable – invalid date range.")
             return
         if end_year < start_year:
-            self.failed.emit("Coverage preview unavailable – invalid date range.")
+            self.signals.failed.emit("Coverage preview unavailable – invalid date range.")
             return
         bins, step = self._build_bins(start_year, end_year)
         results: list[dict[str, object]] = []
-        for label, year_start, year_end in bins:
-            if self.isInterruptionRequested():
-                return
-            start = f"{year_start:04d}-01-01"
-            end = f"{year_end:04d}-12-31"
-            try:
-                has_data = has_data_in_range(
+        if not bins:
+            self.signals.failed.emit("Coverage preview unavailable for this selection.")
+            return
+        session = self._session or _shared_session()
+        # Each bin is an independent network round-trip, so fan them out and
+        # collect the answers in bin order.
+        probe = partial(cached_has_data, session=session)
+        executor = ThreadPoolExecutor(max_workers=min(16, len(bins)))
+        try:
+            futures = [
+                executor.submit(
+                    probe,
                     self._station,
                     self._dataset,
                     self._datatype,
-                    start,
-                    end,
+                    f"{year_start:04d}-01-01",
+                    f"{year_end:04d}-12-31",
                     self._token,
                 )
-            except Exception as exc:
-                self.failed.emit(f"Coverage preview failed: {exc}")
-                return
-            results.append(
-                {
-                    "label": label,
-                    "value": 100.0 if has_data else 0.0,
-                    "start": year_start,
-                    "end": year_end,
-                }
-            )
+                for _label, year_start, year_end in bins
+            ]
+            for (label, year_start, year_end), future in zip(bins, futures):
+                if not self._wait_for(future):
+                    return
+                try:
+                    has_data = future.result()
+                except Exception as exc:
+                    self.signals.failed.emit(f"Coverage preview failed: {exc}")
+                    return
+                results.append(
+                    {
+                        "label": label,
+                        "value": 100.0 if has_data else 0.0,
+                        "start": year_start,
+                        "end": year_end,
+                    }
+                )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
         if not results:
-            self.failed.emit("Coverage preview unavailable for this selection.")
+            self.signals.failed.emit("Coverage preview unavailable for this selection.")
             return
-        self.coverage_ready.emit(results, step)
+        self.signals.coverage_ready.emit(results, step)
 
 
-class StationSearchWorker(QtCore.QThread):
-    """Background worker that performs city based station lookups."""
+class CoverageCheckSignals(QtCore.QObject):
+    """Signal bridge for :class:`CoverageCheck` runnables."""
+
+    # (station, dataset, datatype, start, end, token), bool or Exception
+    result = QtCore.pyqtSignal(tuple, object)
+
+
+class CoverageCheck(QtCore.QRunnable):
+    """Run a single ``has_data_in_range`` query on a thread pool."""
+
+    def __init__(
+        self,
+        station: str,
+        dataset: str,
+        datatype: str,
+        start: str,
+        end: str,
+        token: str,
+        signals: CoverageCheckSignals,
+    ) -> None:
+        super().__init__()
+        self._key = (station, dataset, datatype, start, end, token)
+        self._signals = signals
+
+    def run(self) -> None:
+        try:
+            outcome: object = cached_has_data(*self._key)
+        except Exception as exc:
+            outcome = exc
+        self._signals.result.emit(self._key, outcome)
+
 
+class StationSearchSignals(QtCore.QObject):
     result_ready = QtCore.pyqtSignal(list)
     error = QtCore.pyqtSignal(str)
     message = QtCore.pyqtSignal(str)
+    finished = QtCore.pyqtSignal()
+
+
+class StationSearchWorker(_CancellableRunnable):
+    """Background worker that performs city based station lookups."""
 
-    def __init__(self, city: str, token: str, parent: Optional[QtCore.QObject] = None):
-        super().__init__(parent)
+    def __init__(
+        self,
+        city: str,
+        token: str,
+        session: requests.Session | None = None,
+        cancel_event: threading.Event | None = None,
+    ):
+        super().__init__(self._run, cancel_event)
+        self.signals = StationSearchSignals()
         self._city = city
         self._token = token
+        self._session = session
 
-    def run(self) -> None:
+    def _run(self) -> None:
         headers = {"token": self._token}
+        session = self._session or _shared_session()
         try:
-            stations = find_stations_by_city(self._city, headers, limit=20)
+            stations = find_stations_by_city(
+                self._city, headers, limit=20, session=session
+            )
         except Exception as exc:
-            self.error.emit(f"Station search failed: {exc}")
+            self.signals.error.emit(f"Station search failed: {exc}")
             return
 
-        if not stations and not self.isInterruptionRequested():
-            self.message.emit("No stations found, expanding search radius...")
+        if not stations and not self.is_cancelled():
+            self.signals.message.emit("No stations found, expanding search radius...")
             try:
                 stations = find_stations_by_city(
                     self._city,
                     headers,
                     buffer=1.0,
                     limit=20,
+                    session=session,
                 )
             except Exception as exc:
-                self.error.emit(f"Station search failed: {exc}")
+                self.signals.error.emit(f"Station search failed: {exc}")
                 return
 
-        if self.isInterruptionRequested():
+        if self.is_cancelled():
             return
 
-        self.result_ready.emit(stations)
+        self.signals.result_ready.emit(stations)
 
 
-class DatatypeFetcher(QtCore.QThread):
+class DatatypeFetcherSignals(QtCore.QObject):
     datatypes_ready = QtCore.pyqtSignal(str, str, list)
     error = QtCore.pyqtSignal(str, str, str)
+    finished = QtCore.pyqtSignal()
+
 
+class DatatypeFetcher(_CancellableRunnable):
     def __init__(
         self,
         station: str,
@@ -150,16 +382,20 @@ class DatatypeFetcher(QtCore.QThread):
         token: str,
         dataset_mindate: str | None = None,
         dataset_maxdate: str | None = None,
-        parent: Optional[QtCore.QObject] = None,
+        session: requests.Session | None = None,
+        cancel_event: threading.Event | None = None,
     ):
-        super().__init__(parent)
+        super().__init__(self._run, cancel_event)
+        self.signals = DatatypeFetcherSignals()
         self._station = station
         self._dataset = dataset
         self._token = token
         self._dataset_mindate = dataset_mindate
         self._dataset_maxdate = dataset_maxdate
+        self._session = session
 
-    def run(self) -> None:
+    def _run(self) -> None:
+        session = self._session or _shared_session()
         try:
             dtypes = available_datatypes_with_extents(
                 self._station,
@@ -167,15 +403,16 @@ class DatatypeFetcher(QtCore.QThread):
                 self._token,
                 dataset_mindate=self._dataset_mindate,
                 dataset_maxdate=self._dataset_maxdate,
+                session=session,
             )
         except Exception as exc:
-            self.error.emit(self._station, self._dataset, str(exc))
+            self.signals.error.emit(self._station, self._dataset, str(exc))
             return
         # Determine a reasonable period of record for the station across
         # the selected dataset.
         try:
             station_min, station_max = station_period_of_record(
-                self._station, self._dataset, self._token, timeout=20
+                self._station, self._dataset, self._token, timeout=20, session=session
             )
         except Exception:
             station_min = None
@@ -185,22 +422,23 @@ class DatatypeFetcher(QtCore.QThread):
             station_min = _normalise_iso_date(station_min)
         if station_max:
             station_max = _normalise_iso_date(station_max)
-        normalised: list[dict] = []
+        # The extents helper builds fresh dicts on every call, so they are
+        # normalised in place rather than copied.
+        norm = _normalise_iso_date
+        threshold = _EARLY_THRESHOLD
         for dtype in dtypes:
-            dt_item = dict(dtype)
             # Normalise the datatype dates returned by the API
-            dt_item["mindate"] = _normalise_iso_date(dt_item.get("mindate"))
-            dt_item["maxdate"] = _normalise_iso_date(dt_item.get("maxdate"))
+            md = norm(dtype.get("mindate")) or ""
+            mx = norm(dtype.get("maxdate")) or ""
             # If the datatype period appears missing or implausibly early
             # (e.g. before 1800) then substitute the station period of
             # record obtained above.
-            md = dt_item.get("mindate") or ""
-            if not md or (len(md) >= 10 and md < "1800-01-01"):
-                if station_min:
-                    dt_item["mindate"] = station_min
-            mx = dt_item.get("maxdate") or ""
-            if not mx or (len(mx) >= 10 and mx < "1800-01-01"):
-                if station_max:
-                    dt_item["maxdate"] = station_max
-            normalised.append(dt_item)
-        self.datatypes_ready.emit(self._station, self._dataset, normalised)
+            if station_min and (not md or md[:10] < threshold):
+                md = station_min
+            if station_max and (not mx or mx[:10] < threshold):
+                mx = station_max
+            dtype["mindate"] = md
+            dtype["maxdate"] = mx
+        if self.is_cancelled():
+            return
+        self.signals.datatypes_ready.emit(self._station, self._dataset, dtypes)
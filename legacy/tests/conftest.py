@@ -0,0 +1,46 @@
+"""Import the local ``legacy`` sources under the ``hh_tools`` names they use.
+
+The GUI modules import each other as ``hh_tools.download_rainfall`` and
+``hh_tools.gui.*``.  When the installed package is not importable, those
+names are resolved to the files in this directory instead.
+"""
+from __future__ import annotations
+
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+LEGACY = Path(__file__).resolve().parents[1]
+
+_MODULES = {
+    "hh_tools.download_rainfall": (LEGACY / "download_rainfall.py", None),
+    "hh_tools.gui.theme": (LEGACY / "theme.py", None),
+    "hh_tools.gui.download_rainfall": (
+        LEGACY / "download_rainfall" / "__init__.py",
+        [str(LEGACY / "download_rainfall")],
+    ),
+}
+
+
+class _LegacyFinder(importlib.abc.MetaPathFinder):
+    def find_spec(self, name, path, target=None):
+        if name in ("hh_tools", "hh_tools.gui"):
+            spec = importlib.machinery.ModuleSpec(name, None, is_package=True)
+            spec.submodule_search_locations = []
+            return spec
+        entry = _MODULES.get(name)
+        if entry is None:
+            return None
+        location, search = entry
+        return importlib.util.spec_from_file_location(
+            name, location, submodule_search_locations=search
+        )
+
+
+# Appended so a real hh_tools install still takes precedence.
+sys.meta_path.append(_LegacyFinder())
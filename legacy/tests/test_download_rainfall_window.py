@@ -0,0 +1,35 @@
+import pytest
+
+QtCore = pytest.importorskip("PyQt5.QtCore")
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+
+# Resolved to legacy/download_rainfall/window.py by conftest when hh_tools is
+# not installed.
+from hh_tools.gui.download_rainfall import window as window_mod  # noqa: E402
+
+
+@pytest.fixture
+def qapp():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    yield app
+
+
+@pytest.fixture
+def empty_settings(tmp_path):
+    QtCore.QSettings.setDefaultFormat(QtCore.QSettings.IniFormat)
+    QtCore.QSettings.setPath(
+        QtCore.QSettings.IniFormat, QtCore.QSettings.UserScope, str(tmp_path)
+    )
+    yield
+
+
+def test_window_builds_with_empty_settings(qapp, empty_settings):
+    win = window_mod.DownloadRainfallWindow()
+    try:
+        today = QtCore.QDate.currentDate()
+        first_this_month = QtCore.QDate(today.year(), today.month(), 1)
+        assert win.start_date.date() == first_this_month.addMonths(-1)
+        assert win.end_date.date() == first_this_month.addDays(-1)
+    finally:
+        win.close()
+        win.deleteLater()
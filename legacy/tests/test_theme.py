@@ -0,0 +1,39 @@
+import pytest
+
+QtCore = pytest.importorskip("PyQt5.QtCore")
+QtGui = pytest.importorskip("PyQt5.QtGui")
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+
+# Resolved to legacy/theme.py by conftest when hh_tools is not installed.
+from hh_tools.gui import theme  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def dark_app():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    theme.apply_dark_palette(app)
+    yield app
+
+
+def _pixel(widget, x, y):
+    widget.resize(widget.sizeHint().expandedTo(widget.size()))
+    return QtGui.QColor(widget.grab().toImage().pixel(x, y)).name()
+
+
+def test_scrollbar_slider_is_painted_by_proxy(dark_app):
+    bar = QtWidgets.QScrollBar(QtCore.Qt.Vertical)
+    bar.setRange(0, 100)
+    bar.setPageStep(100)
+    bar.resize(12, 200)
+    # The slider fills half the bar and starts at the top; sample its middle.
+    assert _pixel(bar, 6, 50) == "#424242"
+    # No arrow buttons: the groove runs to the very end of the bar.
+    assert _pixel(bar, 6, 198) == "#1e1e1e"
+
+
+def test_pressed_tool_button_panel_is_painted_by_proxy(dark_app):
+    button = QtWidgets.QToolButton()
+    button.setAutoRaise(True)
+    button.resize(40, 24)
+    button.setDown(True)
+    assert _pixel(button, 3, 12) == "#007acc"
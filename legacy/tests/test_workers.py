@@ -0,0 +1,32 @@
+import pytest
+
+pytest.importorskip("PyQt5.QtCore")
+
+# Resolved to legacy/download_rainfall/workers.py by conftest when hh_tools is
+# not installed.
+from hh_tools.gui.download_rainfall.workers import CoverageProbeWorker  # noqa: E402
+
+
+def _reference_bins(start_year, end_year):
+    """The while-loop binning _build_bins replaced."""
+    span = max(1, end_year - start_year + 1)
+    step = 1 if span <= 20 else 5 if span <= 60 else 10
+    bins = []
+    year = start_year - (start_year % step)
+    while year <= end_year:
+        lo = max(start_year, year)
+        hi = min(end_year, year + step - 1)
+        label = str(lo) if step == 1 or lo == hi else f"{lo}–{hi}"
+        bins.append((label, lo, hi))
+        year += step
+    return bins, step
+
+
+@pytest.mark.parametrize(
+    "start_year, end_year",
+    [(2020, 2020), (2001, 2020), (1990, 2021), (1993, 2050), (1901, 2024), (1955, 2021)],
+)
+def test_build_bins_matches_reference(start_year, end_year):
+    assert CoverageProbeWorker._build_bins(start_year, end_year) == _reference_bins(
+        start_year, end_year
+    )
@@ -1,269 +1,255 @@
 # theme.py
-from PyQt5 import QtCore, QtGui, QtWidgets
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+# PyQt is imported inside the functions that need it, so importing this
+# module for the stylesheet strings alone stays cheap.
+if TYPE_CHECKING:
+    from PyQt5 import QtGui, QtWidgets
+
+
+@lru_cache(maxsize=None)
+def _c(hex_str: str) -> QtGui.QColor:
+    """Return a shared :class:`QtGui.QColor` for ``hex_str``."""
+    from PyQt5 import QtGui
+
+    return QtGui.QColor(hex_str)
+
+
+@lru_cache(maxsize=None)
+def _brush(hex_str: str) -> QtGui.QBrush:
+    from PyQt5 import QtGui
+
+    return QtGui.QBrush(_c(hex_str))
+
+
+# Modern Dark Palette
+# Backgrounds: #1e1e1e (window), #252526 (base), #2d2d30 (alternate)
+# Accents: #007acc (highlight), #3e3e42 (button)
+# Text: #d4d4d4 (text), #858585 (disabled)
+#
+# (group, role, colour); a ``None`` group sets the role for every group.
+@lru_cache(maxsize=1)
+def _palette_spec() -> tuple:
+    from PyQt5 import QtGui
+
+    _P = QtGui.QPalette
+    return (
+        # Base colors
+        (None, _P.Window, "#1e1e1e"),
+        (None, _P.WindowText, "#d4d4d4"),
+        (None, _P.Base, "#252526"),
+        (None, _P.AlternateBase, "#2d2d30"),
+        (None, _P.ToolTipBase, "#2d2d30"),
+        (None, _P.ToolTipText, "#d4d4d4"),
+        (None, _P.Text, "#d4d4d4"),
+        # Button colors
+        (None, _P.Button, "#3e3e42"),
+        (None, _P.ButtonText, "#d4d4d4"),
+        (None, _P.BrightText, "#ffffff"),
+        # Highlight colors
+        (None, _P.Highlight, "#007acc"),
+        (None, _P.HighlightedText, "#ffffff"),
+        (None, _P.Link, "#3794ff"),
+        (None, _P.LinkVisited, "#3794ff"),
+        # Disabled colors
+        (_P.Disabled, _P.WindowText, "#858585"),
+        (_P.Disabled, _P.Text, "#858585"),
+        (_P.Disabled, _P.ButtonText, "#858585"),
+        (_P.Disabled, _P.Highlight, "#2d2d30"),
+        (_P.Disabled, _P.HighlightedText, "#858585"),
+    )
+
+
+@lru_cache(maxsize=1)
+def _dark_proxy_style_class() -> type:
+    from PyQt5 import QtCore, QtGui, QtWidgets
+
+    _S = QtWidgets.QStyle
+
+    class DarkProxyStyle(QtWidgets.QProxyStyle):
+        """Fusion with tool button panels and scrollbars painted natively.
+
+        Painting these here instead of through ``:hover`` rules keeps Qt's
+        stylesheet engine from re-matching selectors on every mouse move.
+        The stylesheet must not style QToolButton or QScrollBar at all:
+        once a rule matches, the stylesheet engine paints the control itself
+        and never reaches this style.
+        """
+
+        def drawPrimitive(self, element, option, painter, widget=None):
+            if element == _S.PE_PanelButtonTool:
+                state = option.state
+                if state & (_S.State_Sunken | _S.State_On):
+                    colour = _c("#007acc")
+                elif state & _S.State_MouseOver and state & _S.State_Enabled:
+                    colour = _c("#3e3e42")
+                else:
+                    return
+                painter.save()
+                painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+                painter.setPen(QtCore.Qt.NoPen)
+                painter.setBrush(colour)
+                painter.drawRoundedRect(QtCore.QRectF(option.rect), 4, 4)
+                painter.restore()
+                return
+            super().drawPrimitive(element, option, painter, widget)
+
+        def drawControl(self, element, option, painter, widget=None):
+            if element == _S.CE_ScrollBarSlider:
+                hover = option.state & (_S.State_MouseOver | _S.State_Sunken)
+                rect = QtCore.QRectF(option.rect).adjusted(2, 2, -2, -2)
+                radius = min(rect.width(), rect.height()) / 2
+                painter.save()
+                painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+                painter.setPen(QtCore.Qt.NoPen)
+                painter.setBrush(_c("#686868" if hover else "#424242"))
+                painter.drawRoundedRect(rect, radius, radius)
+                painter.restore()
+                return
+            super().drawControl(element, option, painter, widget)
+
+        # Fusion paints its scrollbar slider inline, so the whole bar is drawn
+        # here: a flat groove with no arrow buttons and a rounded slider.
+        def drawComplexControl(self, control, option, painter, widget=None):
+            if control != _S.CC_ScrollBar:
+                super().drawComplexControl(control, option, painter, widget)
+                return
+            painter.fillRect(option.rect, _c("#1e1e1e"))
+            slider = QtWidgets.QStyleOptionSlider(option)
+            slider.rect = self.subControlRect(control, option, _S.SC_ScrollBarSlider, widget)
+            if not option.activeSubControls & _S.SC_ScrollBarSlider:
+                slider.state &= ~(_S.State_MouseOver | _S.State_Sunken)
+            if slider.rect.isValid():
+                self.drawControl(_S.CE_ScrollBarSlider, slider, painter, widget)
+
+        def subControlRect(self, control, option, sub, widget=None):
+            if control != _S.CC_ScrollBar:
+                return super().subControlRect(control, option, sub, widget)
+            rect = option.rect
+            horizontal = option.orientation == QtCore.Qt.Horizontal
+            length = rect.width() if horizontal else rect.height()
+            span = option.maximum - option.minimum
+            if span <= 0:
+                slider_len = length
+            else:
+                slider_len = length * option.pageStep // (span + option.pageStep)
+                slider_min = self.pixelMetric(_S.PM_ScrollBarSliderMin, option, widget)
+                slider_len = min(length, max(slider_min, slider_len))
+            pos = _S.sliderPositionFromValue(
+                option.minimum,
+                option.maximum,
+                option.sliderPosition,
+                length - slider_len,
+                option.upsideDown,
+            )
+            if sub == _S.SC_ScrollBarSlider:
+                lo, size = pos, slider_len
+            elif sub == _S.SC_ScrollBarSubPage:
+                lo, size = 0, pos
+            elif sub == _S.SC_ScrollBarAddPage:
+                lo, size = pos + slider_len, length - pos - slider_len
+            elif sub == _S.SC_ScrollBarGroove:
+                lo, size = 0, length
+            else:
+                # Arrow buttons are hidden.
+                return QtCore.QRect()
+            if horizontal:
+                sub_rect = QtCore.QRect(rect.x() + lo, rect.y(), size, rect.height())
+            else:
+                sub_rect = QtCore.QRect(rect.x(), rect.y() + lo, rect.width(), size)
+            return self.visualRect(option.direction, rect, sub_rect)
+
+        def pixelMetric(self, metric, option=None, widget=None):
+            if metric == _S.PM_ScrollBarExtent:
+                return 12
+            if metric == _S.PM_ScrollBarSliderMin:
+                return 20
+            return super().pixelMetric(metric, option, widget)
+
+    return DarkProxyStyle
+
+
+def __getattr__(name: str):
+    # ``DarkProxyStyle`` subclasses a Qt type, so it is only built on request.
+    if name == "DarkProxyStyle":
+        return _dark_proxy_style_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1)
+def _dark_palette() -> QtGui.QPalette:
+    """Build the dark palette once; ``setPalette`` copies it implicitly-shared."""
+    from PyQt5 import QtGui
+
+    palette = QtGui.QPalette()
+    set_brush = palette.setBrush
+    for group, role, hex_str in _palette_spec():
+        if group is None:
+            set_brush(role, _brush(hex_str))
+        else:
+            set_brush(group, role, _brush(hex_str))
+    return palette
+
 
 def apply_dark_palette(app: QtWidgets.QApplication) -> None:
     """Apply a modern dark theme to the application."""
-    app.setStyle("Fusion")
-    app.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps, True)
+    from PyQt5 import QtCore
 
-    # Modern Dark Palette
-    # Backgrounds: #1e1e1e (window), #252526 (base), #2d2d30 (alternate)
-    # Accents: #007acc (highlight), #3e3e42 (button)
-    # Text: #d4d4d4 (text), #858585 (disabled)
+    app.setStyle(_dark_proxy_style_class()("Fusion"))
+    app.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps, True)
 
-    palette = QtGui.QPalette()
-    
-    # Base colors
-    palette.setColor(QtGui.QPalette.Window, QtGui.QColor("#1e1e1e"))
-    palette.setColor(QtGui.QPalette.WindowText, QtGui.QColor("#d4d4d4"))
-    palette.setColor(QtGui.QPalette.Base, QtGui.QColor("#252526"))
-    palette.setColor(QtGui.QPalette.AlternateBase, QtGui.QColor("#2d2d30"))
-    palette.setColor(QtGui.QPalette.ToolTipBase, QtGui.QColor("#2d2d30"))
-    palette.setColor(QtGui.QPalette.ToolTipText, QtGui.QColor("#d4d4d4"))
-    palette.setColor(QtGui.QPalette.Text, QtGui.QColor("#d4d4d4"))
-    
-    # Button colors
-    palette.setColor(QtGui.QPalette.Button, QtGui.QColor("#3e3e42"))
-    palette.setColor(QtGui.QPalette.ButtonText, QtGui.QColor("#d4d4d4"))
-    palette.setColor(QtGui.QPalette.BrightText, QtGui.QColor("#ffffff"))
-    
-    # Highlight colors
-    palette.setColor(QtGui.QPalette.Highlight, QtGui.QColor("#007acc"))
-    palette.setColor(QtGui.QPalette.HighlightedText, QtGui.QColor("#ffffff"))
-    palette.setColor(QtGui.QPalette.Link, QtGui.QColor("#3794ff"))
-    palette.setColor(QtGui.QPalette.LinkVisited, QtGui.QColor("#3794ff"))
-
-    # Disabled colors
-    palette.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.WindowText, QtGui.QColor("#858585"))
-    palette.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.Text, QtGui.QColor("#858585"))
-    palette.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.ButtonText, QtGui.QColor("#858585"))
-    palette.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.Highlight, QtGui.QColor("#2d2d30"))
-    palette.setColor(QtGui.QPalette.Disabled, QtGui.QPalette.HighlightedText, QtGui.QColor("#858585"))
-
-    app.setPalette(palette)
+    app.setPalette(_dark_palette())
     apply_global_styles(app)
 
 
+_QSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_QSS_SPACE_RE = re.compile(r"\s+")
+_QSS_PUNCT_RE = re.compile(r"\s*([{}:;,])\s*")
+
+
+def _minify_qss(source: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    text = _QSS_COMMENT_RE.sub("", source)
+    text = _QSS_SPACE_RE.sub(" ", text)
+    return _QSS_PUNCT_RE.sub(r"\1", text).strip()
+
+
+# The app-wide sheet lives next to this module; it is read and minified on
+# first use.
+_QSS_PATH = Path(__file__).with_name("theme.qss")
+
+
+@lru_cache(maxsize=1)
+def _global_qss() -> str:
+    return _minify_qss(_QSS_PATH.read_text(encoding="utf-8"))
+
+
 def apply_global_styles(app: QtWidgets.QApplication) -> None:
-    """App-wide QSS for a modern look."""
-    qss = """
-    * {
-        font-family: "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
-        font-size: 10pt;
-    }
-    
-    QMainWindow, QDialog {
-        background-color: #1e1e1e;
-    }
-
-    QWidget {
-        color: #d4d4d4;
-    }
-
-    /* ---- Toolbar ---- */
-    QToolBar { background: #252526; border: none; padding: 6px; }
-    QToolBar QToolButton { padding: 6px 10px; border-radius: 4px; }
-    QToolBar QToolButton:hover  { background: #3e3e42; }
-    QToolBar QToolButton:pressed{ background: #007acc; }
-
-    /* ---- Header ---- */
-    #header { color: #ffffff; font-size: 22pt; font-weight: 750; padding: 6px 2px 2px 2px; }
-
-    /* --- Inputs --- */
-    QLineEdit, QDateEdit, QComboBox, QSpinBox, QDoubleSpinBox {
-        background-color: #3c3c3c;
-        border: 1px solid #3e3e42;
-        border-radius: 4px;
-        padding: 4px 8px;
-        selection-background-color: #007acc;
-        min-height: 20px;
-    }
-    QLineEdit:focus, QDateEdit:focus, QComboBox:focus {
-        border: 1px solid #007acc;
-        background-color: #252526;
-    }
-    QLineEdit:disabled, QDateEdit:disabled, QComboBox:disabled {
-        background-color: #2d2d30;
-        color: #858585;
-        border: 1px solid #2d2d30;
-    }
-
-    /* --- Buttons --- */
-    QPushButton {
-        background-color: #3e3e42;
-        border: 1px solid #3e3e42;
-        border-radius: 4px;
-        padding: 5px 15px;
-        color: #d4d4d4;
-    }
-    QPushButton:hover {
-        background-color: #4e4e52;
-        border: 1px solid #4e4e52;
-    }
-    QPushButton:pressed {
-        background-color: #007acc;
-        border: 1px solid #007acc;
-        color: #ffffff;
-    }
-    QPushButton:disabled {
-        background-color: #2d2d30;
-        border: 1px solid #2d2d30;
-        color: #858585;
-    }
-    QToolButton {
-        background-color: transparent;
-        border: none;
-        border-radius: 4px;
-        padding: 4px;
-    }
-    QToolButton:hover {
-        background-color: #3e3e42;
-    }
-    QToolButton:pressed {
-        background-color: #007acc;
-    }
-
-    /* --- Lists & Tables --- */
-    QListWidget, QTableWidget, QTreeWidget, QPlainTextEdit {
-        background-color: #252526;
-        border: 1px solid #3e3e42;
-        border-radius: 4px;
-        gridline-color: #3e3e42;
-    }
-    QHeaderView::section {
-        background-color: #2d2d30;
-        border: none;
-        border-right: 1px solid #3e3e42;
-        border-bottom: 1px solid #3e3e42;
-        padding: 4px;
-        font-weight: bold;
-    }
-    QTableWidget::item {
-        padding: 4px;
-    }
-    QTableWidget::item:selected, QListWidget::item:selected {
-        background-color: #007acc;
-        color: #ffffff;
-    }
-
-    /* --- Scrollbars --- */
-    QScrollBar:vertical {
-        background: #1e1e1e;
-        width: 12px;
-        margin: 0px;
-    }
-    QScrollBar::handle:vertical {
-        background: #424242;
-        min-height: 20px;
-        border-radius: 6px;
-        margin: 2px;
-    }
-    QScrollBar::handle:vertical:hover {
-        background: #686868;
-    }
-    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-        height: 0px;
-    }
-    QScrollBar:horizontal {
-        background: #1e1e1e;
-        height: 12px;
-        margin: 0px;
-    }
-    QScrollBar::handle:horizontal {
-        background: #424242;
-        min-width: 20px;
-        border-radius: 6px;
-        margin: 2px;
-    }
-    QScrollBar::handle:horizontal:hover {
-        background: #686868;
-    }
-    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-        width: 0px;
-    }
-
-    /* --- Tabs --- */
-    QTabWidget::pane {
-        border: 1px solid #3e3e42;
-        border-radius: 4px;
-        top: -1px; 
-    }
-    QTabBar::tab {
-        background: #2d2d30;
-        border: 1px solid #3e3e42;
-        border-bottom: none;
-        border-top-left-radius: 4px;
-        border-top-right-radius: 4px;
-        padding: 6px 12px;
-        margin-right: 2px;
-        color: #858585;
-    }
-    QTabBar::tab:selected {
-        background: #1e1e1e;
-        border-bottom: 1px solid #1e1e1e; 
-        color: #d4d4d4;
-        font-weight: bold;
-    }
-    QTabBar::tab:hover:!selected {
-        background: #3e3e42;
-        color: #d4d4d4;
-    }
-
-    /* --- GroupBox --- */
-    QGroupBox {
-        border: 1px solid #3e3e42;
-        border-radius: 4px;
-        margin-top: 20px;
-        font-weight: bold;
-    }
-    QGroupBox::title {
-        subcontrol-origin: margin;
-        subcontrol-position: top left;
-        padding: 0 5px;
-        left: 10px;
-    }
-
-    /* --- Splitter --- */
-    QSplitter::handle {
-        background-color: #3e3e42;
-    }
-    QSplitter::handle:hover {
-        background-color: #007acc;
-    }
-    
-    /* --- Tooltips --- */
-    QToolTip {
-        background-color: #252526;
-        color: #d4d4d4;
-        border: 1px solid #3e3e42;
-        padding: 4px;
-    }
-    
-    /* --- Custom Card (for Launcher) --- */
-    #card {
-        background-color: #252526;
-        border: 1px solid #3e3e42;
-        border-radius: 8px;
-    }
-    #card:hover {
-        border: 1px solid #007acc;
-        background-color: #2d2d30;
-    }
-    #pinBadge { color: #FFD166; font-size: 13pt; margin-right: 2px; }
-
-    /* Icon button inside a card */
-    QFrame#card QToolButton {
-        padding: 0px; margin: 0px; border: none; border-radius: 12px;
-        background: transparent;
-    }
-    QFrame#card QToolButton:hover  { background: rgba(255,255,255,0.07); }
-    QFrame#card QToolButton:pressed{ background: rgba(42,130,218,0.35); }
-
-    /* Text inside cards */
-    QFrame#card QLabel { color: #eaeaea; }
-
-    /* Scroll/status */
-    QScrollArea { border: none; background: transparent; }
-    QStatusBar { background: #252526; border-top: 1px solid #3e3e42; color: #d4d4d4; }
+    """App-wide QSS and font for a modern look.
+
+    Setting the sheet again would re-parse it and repolish every widget, so
+    repeat calls on the same application are no-ops; use
+    :func:`force_reapply_styles` to reset it deliberately.
     """
-    app.setStyleSheet(qss)
+    from PyQt5 import QtGui
+
+    if app.property("_dark_theme_installed"):
+        return
+    app.setProperty("_dark_theme_installed", True)
+    # Set on the application rather than via a ``*`` rule, which the
+    # stylesheet engine would match against every widget on polish.
+    font = QtGui.QFont("Segoe UI", 10)
+    font.setStyleHint(QtGui.QFont.SansSerif)
+    app.setFont(font)
+    app.setStyleSheet(_global_qss())
+
+
+def force_reapply_styles(app: QtWidgets.QApplication) -> None:
+    """Re-apply the app-wide QSS even if it is already installed."""
+    app.setProperty("_dark_theme_installed", False)
+    apply_global_styles(app)
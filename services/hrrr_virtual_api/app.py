@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import math
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 from fastapi import FastAPI, HTTPException, Query
+from scipy.spatial import cKDTree
 
 try:
     from herbie import Herbie
@@ -58,6 +65,15 @@ PARAMETER_MAP: Dict[str, ParameterConfig] = {
     ),
 }
 
+# Upper bound on concurrent Herbie downloads per request, to stay clear of
+# S3 throttling.
+FETCH_CONCURRENCY = int(os.getenv("HRRR_FETCH_CONCURRENCY", "8"))
+
+# Decoded CONUS fields are tens of MB each, so the field cache is bounded by
+# bytes and entries expire to hand the memory back between request bursts.
+FIELD_CACHE_BYTES = int(os.getenv("HRRR_FIELD_CACHE_MB", "256")) * 1024 * 1024
+FIELD_CACHE_TTL = float(os.getenv("HRRR_FIELD_CACHE_TTL", "600"))
+
 WINDOW_HOURS = {
     "hourly": 1,
     "3-hour": 3,
@@ -68,6 +84,28 @@ WINDOW_HOURS = {
 def parse_iso_datetime(value: Optional[str], fallback: datetime) -> datetime:
     if not value:
         return fallback
+    # Fast path for the canonical "YYYY-MM-DDTHH:MM:SSZ" form.
+    if (
+        len(value) == 20
+        and value[19] == "Z"
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[10] == "T"
+        and value[13] == ":"
+        and value[16] == ":"
+    ):
+        try:
+            return datetime(
+                int(value[0:4]),
+                int(value[5:7]),
+                int(value[8:10]),
+                int(value[11:13]),
+                int(value[14:16]),
+                int(value[17:19]),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
     normalized = value.replace("Z", "+00:00")
     dt = datetime.fromisoformat(normalized)
     if dt.tzinfo is None:
@@ -86,64 +124,124 @@ def iter_hourly(start: datetime, end: datetime) -> Iterable[datetime]:
         current += timedelta(hours=1)
 
 
-def aggregate_points(points: List[dict], mode: str, window_hours: int, parameter: str) -> List[dict]:
-    if window_hours == 1:
-        return points
+def format_epoch(epoch: int) -> str:
+    t = time.gmtime(epoch)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}Z"
+    )
 
-    window_seconds = window_hours * 3600
-    buckets: Dict[int, List[float]] = {}
-
-    for point in points:
-        ts = datetime.fromisoformat(point["timestamp"].replace("Z", "+00:00"))
-        bucket = int(ts.timestamp()) // window_seconds
-        buckets.setdefault(bucket, []).append(point["value"])
-
-    aggregated: List[dict] = []
-    for bucket, values in sorted(buckets.items(), key=lambda item: item[0]):
-        timestamp = datetime.fromtimestamp(bucket * window_seconds, tz=timezone.utc)
-        if mode == "sum":
-            value = float(sum(values))
-        else:
-            value = float(sum(values) / len(values))
 
-        aggregated.append(
+def aggregate_points(
+    points: List[Tuple[int, float]], mode: str, window_hours: int, parameter: str
+) -> List[dict]:
+    """Bucket time-ordered ``(epoch_seconds, value)`` points into response entries."""
+    if window_hours == 1:
+        return [
             {
-                "timestamp": timestamp.isoformat().replace("+00:00", "Z"),
+                "timestamp": format_epoch(epoch),
                 "value": value,
-                "interval": window_hours * 60,
+                "interval": 60,
                 "parameter": parameter,
             }
-        )
+            for epoch, value in points
+        ]
 
-    return aggregated
+    if not points:
+        return []
 
+    window_seconds = window_hours * 3600
+    epochs = np.fromiter((epoch for epoch, _value in points), dtype=np.int64, count=len(points))
+    values = np.fromiter((value for _epoch, value in points), dtype=np.float64, count=len(points))
+
+    # np.unique sorts the bucket ids, so the output stays in time order.
+    buckets, inverse = np.unique(epochs // window_seconds, return_inverse=True)
+    totals = np.bincount(inverse, weights=values)
+    if mode != "sum":
+        totals /= np.bincount(inverse)
+
+    interval = window_hours * 60
+    return [
+        {
+            "timestamp": format_epoch(bucket * window_seconds),
+            "value": float(total),
+            "interval": interval,
+            "parameter": parameter,
+        }
+        for bucket, total in zip(buckets.tolist(), totals.tolist())
+    ]
+
+
+# KD-trees over the 2-D lat/lon grids, keyed by grid shape and corner
+# coordinates.  Every HRRR field shares one grid, so this stays tiny.  Each
+# entry is a future so concurrent cold-start lookups wait on one build.
+_GRID_TREES: "OrderedDict[tuple, Future]" = OrderedDict()
+_GRID_TREES_MAX = 4
+_GRID_TREES_LOCK = threading.Lock()
+
+
+def grid_tree(lats: np.ndarray, lons: np.ndarray) -> cKDTree:
+    key = (
+        lats.shape,
+        float(lats[0, 0]),
+        float(lats[-1, -1]),
+        float(lons[0, 0]),
+        float(lons[-1, -1]),
+    )
+    with _GRID_TREES_LOCK:
+        future = _GRID_TREES.get(key)
+        build = future is None
+        if build:
+            future = Future()
+            _GRID_TREES[key] = future
+            while len(_GRID_TREES) > _GRID_TREES_MAX:
+                _GRID_TREES.popitem(last=False)
+        else:
+            _GRID_TREES.move_to_end(key)
+    if build:
+        try:
+            future.set_result(cKDTree(np.column_stack((lats.ravel(), lons.ravel()))))
+        except BaseException as exc:
+            # Let the next lookup retry instead of replaying the failure.
+            with _GRID_TREES_LOCK:
+                if _GRID_TREES.get(key) is future:
+                    del _GRID_TREES[key]
+            future.set_exception(exc)
+            raise
+    return future.result()
+
+
+def select_nearest_values(data_array, coords) -> np.ndarray:
+    """Return the grid values nearest to each ``(lat, lon)`` pair in ``coords``."""
+    points = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
 
-def select_nearest_value(data_array, lat: float, lon: float) -> float:
     if "latitude" in data_array.coords and "longitude" in data_array.coords:
         lats = data_array["latitude"].values
         lons = data_array["longitude"].values
 
         if lats.ndim == 2 and lons.ndim == 2:
-            distances = (lats - lat) ** 2 + (lons - lon) ** 2
-            idx = int(distances.argmin())
-            y, x = divmod(idx, distances.shape[1])
-            value = data_array.values[y, x]
-        else:
-            selected = data_array.sel(latitude=lat, longitude=lon, method="nearest")
-            value = selected.values
+            _dist, idx = grid_tree(lats, lons).query(points, k=1)
+            return data_array.values.ravel()[idx].astype(np.float64)
+        lat_key, lon_key = "latitude", "longitude"
     elif "lat" in data_array.coords and "lon" in data_array.coords:
-        selected = data_array.sel(lat=lat, lon=lon, method="nearest")
-        value = selected.values
+        lat_key, lon_key = "lat", "lon"
     else:
         raise ValueError("Unable to locate latitude/longitude coordinates in HRRR dataset.")
 
-    if hasattr(value, "item"):
-        value = value.item()
+    return np.array(
+        [
+            data_array.sel({lat_key: lat, lon_key: lon}, method="nearest").values
+            for lat, lon in points
+        ],
+        dtype=np.float64,
+    )
+
 
-    if value is None or (isinstance(value, float) and math.isnan(value)):
+def select_nearest_value(data_array, lat: float, lon: float) -> float:
+    value = float(select_nearest_values(data_array, ((lat, lon),))[0])
+    if math.isnan(value):
         raise ValueError("HRRR dataset returned an empty value for the selected point.")
-
-    return float(value)
+    return value
 
 
 def apply_transform(value: float, transform: str) -> float:
@@ -152,41 +250,139 @@ def apply_transform(value: float, transform: str) -> float:
     return value
 
 
-def fetch_point_value(
-    run_time: datetime,
-    lead_hour: int,
-    parameter: ParameterConfig,
-    lat: float,
-    lon: float,
-) -> Optional[float]:
+class _TTLCache:
+    """Thread-safe LRU cache whose entries expire and whose total size is capped."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: "OrderedDict[tuple, Tuple[float, int, object]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _drop(self, key: tuple) -> None:
+        _expires, size, _value = self._entries.pop(key)
+        self._size -= size
+
+    def get(self, key: tuple):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[2]
+
+    def put(self, key: tuple, value, size: int = 1) -> None:
+        if size > self._max_size:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            now = time.monotonic()
+            for stale in [k for k, entry in self._entries.items() if entry[0] <= now]:
+                self._drop(stale)
+            self._entries[key] = (now + self._ttl, size, value)
+            self._size += size
+            while self._size > self._max_size:
+                self._drop(next(iter(self._entries)))
+
+
+# Only handles whose GRIB file was found are cached, so a run that is not
+# published yet is looked up again on the next request.
+_HERBIE_HANDLES = _TTLCache(max_size=64, ttl=FIELD_CACHE_TTL)
+_FIELDS = _TTLCache(max_size=FIELD_CACHE_BYTES, ttl=FIELD_CACHE_TTL)
+
+
+def _herbie_handle(run_time: datetime, lead_hour: int):
     if Herbie is None:
         raise RuntimeError("Herbie dependency is not installed.")
 
-    model = Herbie(
-        run_time,
-        model="hrrr",
-        product="sfc",
-        fxx=lead_hour,
-        save_dir=os.getenv("HRRR_HERBIE_CACHE", ".cache/herbie"),
-        verbose=False,
+    key = (run_time, lead_hour)
+    handle = _HERBIE_HANDLES.get(key)
+    if handle is None:
+        handle = Herbie(
+            run_time,
+            model="hrrr",
+            product="sfc",
+            fxx=lead_hour,
+            save_dir=os.getenv("HRRR_HERBIE_CACHE", ".cache/herbie"),
+            verbose=False,
+        )
+        if getattr(handle, "grib", None) is not None:
+            _HERBIE_HANDLES.put(key, handle)
+    return handle
+
+
+def _field_nbytes(data_array) -> int:
+    return int(data_array.nbytes) + sum(
+        int(coord.nbytes) for coord in data_array.coords.values()
     )
 
-    dataset = model.xarray(parameter.search_string)
+
+def open_hrrr(run_time: datetime, lead_hour: int, search_string: str):
+    """Return the HRRR field matching ``search_string`` for one run/lead, or ``None``.
+
+    Decoded fields are cached for ``FIELD_CACHE_TTL`` seconds within a
+    ``FIELD_CACHE_BYTES`` budget so repeated requests skip the GRIB decode.
+    Missing fields are not cached.
+    """
+    key = (run_time, lead_hour, search_string)
+    cached = _FIELDS.get(key)
+    if cached is not None:
+        return cached
+
+    dataset = _herbie_handle(run_time, lead_hour).xarray(search_string)
     if dataset is None or len(dataset.data_vars) == 0:
         return None
 
     first_var = next(iter(dataset.data_vars))
-    raw_value = select_nearest_value(dataset[first_var], lat=lat, lon=lon)
+    data_array = dataset[first_var]
+    _FIELDS.put(key, data_array, size=_field_nbytes(data_array))
+    return data_array
+
+
+def sample_parameter(data_array, parameter: ParameterConfig, lat: float, lon: float) -> float:
+    raw_value = select_nearest_value(data_array, lat=lat, lon=lon)
     return apply_transform(raw_value, parameter.transform)
 
 
+def sample_run(
+    run_time: datetime,
+    lead_hour: int,
+    parameters: List[ParameterConfig],
+    lat: float,
+    lon: float,
+) -> List[Optional[float]]:
+    """Sample every parameter for one run/lead; failures are logged and yield ``None``."""
+    values: List[Optional[float]] = []
+    for parameter in parameters:
+        try:
+            data_array = open_hrrr(run_time, lead_hour, parameter.search_string)
+            value = (
+                None
+                if data_array is None
+                else sample_parameter(data_array, parameter, lat=lat, lon=lon)
+            )
+        except Exception as exc:
+            logging.warning(
+                "HRRR: skipping point run_time=%s lead=%s param=%s: %s",
+                run_time, lead_hour, parameter.id, exc,
+            )
+            value = None
+        values.append(value)
+    return values
+
+
 @app.get("/health")
 def health() -> dict:
     return {"status": "ok"}
 
 
 @app.get("/hrrr")
-def get_hrrr_series(
+async def get_hrrr_series(
     lat: float = Query(...),
     lon: float = Query(...),
     start: Optional[str] = Query(default=None),
@@ -210,50 +406,56 @@ def get_hrrr_series(
 
     window_hours = WINDOW_HOURS.get(aggregationWindow, 1)
 
-    if productType == "analysis":
-        lead_hours = [0]
+    analysis = productType == "analysis"
+    if analysis:
+        # Analysis fields are lead 0, so run time and valid time coincide and
+        # each valid hour has exactly one candidate.
+        jobs = [(run_time, 0) for run_time in iter_hourly(start_dt, end_dt) if run_time >= start_dt]
     else:
         parsed = [int(x.strip()) for x in leadHours.split(",")] if leadHours else []
         lead_hours = parsed if parsed else list(range(1, 19))
 
-    run_start = start_dt - timedelta(hours=max(lead_hours))
-    run_end = end_dt
+        run_start = start_dt - timedelta(hours=max(lead_hours))
+        jobs = [
+            (run_time, lead)
+            for run_time in iter_hourly(run_start, end_dt)
+            for lead in lead_hours
+            if start_dt <= run_time + timedelta(hours=lead) <= end_dt
+        ]
+    # Herbie blocks on S3 downloads, so each run/lead goes to a worker thread
+    # while the semaphore caps how many are in flight.
+    sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+    async def _one(run_time: datetime, lead: int) -> List[Optional[float]]:
+        async with sem:
+            return await asyncio.to_thread(
+                sample_run, run_time, lead, parameter_configs, lat, lon
+            )
 
     try:
-        series: List[dict] = []
-        for parameter in parameter_configs:
-            by_valid_time: Dict[datetime, tuple[int, float]] = {}
-
-            for run_time in iter_hourly(run_start, run_end):
-                for lead in lead_hours:
-                    valid_time = run_time + timedelta(hours=lead)
-                    if valid_time < start_dt or valid_time > end_dt:
-                        continue
-                    try:
-                        value = fetch_point_value(run_time, lead, parameter, lat=lat, lon=lon)
-                    except Exception as exc:
-                        logging.warning(
-                            "HRRR: skipping point run_time=%s lead=%s param=%s: %s",
-                            run_time, lead, parameter.id, exc,
-                        )
-                        continue
+        sampled = await asyncio.gather(*(_one(run_time, lead) for run_time, lead in jobs))
 
+        series: List[dict] = []
+        for index, parameter in enumerate(parameter_configs):
+            if analysis:
+                parameter_points = [
+                    (int(run_time.timestamp()), values[index])
+                    for (run_time, _lead), values in zip(jobs, sampled)
+                    if values[index] is not None
+                ]
+            else:
+                by_valid_time: Dict[int, tuple[int, float]] = {}
+                for (run_time, lead), values in zip(jobs, sampled):
+                    value = values[index]
                     if value is None:
                         continue
-
+                    valid_time = int(run_time.timestamp()) + lead * 3600
                     prior = by_valid_time.get(valid_time)
                     if prior is None or lead < prior[0]:
                         by_valid_time[valid_time] = (lead, value)
-
-            parameter_points = [
-                {
-                    "timestamp": ts.isoformat().replace("+00:00", "Z"),
-                    "value": value,
-                    "interval": 60,
-                    "parameter": parameter.unified_parameter,
-                }
-                for ts, (_lead, value) in sorted(by_valid_time.items(), key=lambda item: item[0])
-            ]
+                parameter_points = sorted(
+                    (epoch, value) for epoch, (_lead, value) in by_valid_time.items()
+                )
 
             series.extend(
                 aggregate_points(
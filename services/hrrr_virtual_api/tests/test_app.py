@@ -0,0 +1,177 @@
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+pytest.importorskip("fastapi")
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import numpy as np  # noqa: E402
+
+from services.hrrr_virtual_api import app as hrrr  # noqa: E402
+
+
+def _reference_aggregate(points, mode, window_hours, parameter):
+    """The dict-of-lists bucketing aggregate_points replaced."""
+    window_seconds = window_hours * 3600
+    buckets = {}
+    for epoch, value in points:
+        buckets.setdefault(epoch // window_seconds, []).append(value)
+    aggregated = []
+    for bucket, values in sorted(buckets.items()):
+        timestamp = datetime.fromtimestamp(bucket * window_seconds, tz=timezone.utc)
+        value = float(sum(values)) if mode == "sum" else float(sum(values) / len(values))
+        aggregated.append(
+            {
+                "timestamp": timestamp.isoformat().replace("+00:00", "Z"),
+                "value": value,
+                "interval": window_hours * 60,
+                "parameter": parameter,
+            }
+        )
+    return aggregated
+
+
+POINTS = [
+    (1_767_225_600 + hour * 3600, value)
+    for hour, value in enumerate([0.0, 1.5, 2.0, 0.25, 4.0, 3.5, 1.0, 0.5])
+]
+
+
+@pytest.mark.parametrize("mode", ["sum", "average"])
+@pytest.mark.parametrize("window_hours", [3, 6])
+def test_aggregate_points_matches_reference(mode, window_hours):
+    result = hrrr.aggregate_points(POINTS, mode, window_hours, "PRCP")
+    expected = _reference_aggregate(POINTS, mode, window_hours, "PRCP")
+    assert [entry["timestamp"] for entry in result] == [e["timestamp"] for e in expected]
+    assert [entry["interval"] for entry in result] == [e["interval"] for e in expected]
+    np.testing.assert_allclose(
+        [entry["value"] for entry in result], [e["value"] for e in expected]
+    )
+
+
+def test_aggregate_points_skips_empty_buckets():
+    # A 12-hour gap leaves whole 3-hour windows without points.
+    points = [POINTS[0], (POINTS[0][0] + 12 * 3600, 2.0)]
+    result = hrrr.aggregate_points(points, "sum", 3, "PRCP")
+    assert result == _reference_aggregate(points, "sum", 3, "PRCP")
+    assert len(result) == 2
+    assert hrrr.aggregate_points([], "sum", 3, "PRCP") == []
+
+
+def test_aggregate_points_hourly_formats_timestamps():
+    result = hrrr.aggregate_points(POINTS[:2], "sum", 1, "TMP")
+    assert result == [
+        {"timestamp": "2026-01-01T00:00:00Z", "value": 0.0, "interval": 60, "parameter": "TMP"},
+        {"timestamp": "2026-01-01T01:00:00Z", "value": 1.5, "interval": 60, "parameter": "TMP"},
+    ]
+
+
+@pytest.mark.parametrize("epoch", [0, 1_767_225_600, 1_709_164_800 + 86_399])
+def test_format_epoch_matches_datetime(epoch):
+    expected = datetime.fromtimestamp(epoch, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    assert hrrr.format_epoch(epoch) == expected
+
+
+FALLBACK = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2026-01-01T06:00:00Z", datetime(2026, 1, 1, 6, tzinfo=timezone.utc)),
+        ("2026-01-01T06:00:00", datetime(2026, 1, 1, 6, tzinfo=timezone.utc)),
+        ("2026-01-01", datetime(2026, 1, 1, tzinfo=timezone.utc)),
+        ("2026-01-01T01:00:00-05:00", datetime(2026, 1, 1, 6, tzinfo=timezone.utc)),
+        ("2026-01-01T06:00:00.500Z", datetime(2026, 1, 1, 6, 0, 0, 500_000, tzinfo=timezone.utc)),
+        ("", FALLBACK),
+        (None, FALLBACK),
+    ],
+)
+def test_parse_iso_datetime(value, expected):
+    result = hrrr.parse_iso_datetime(value, FALLBACK)
+    assert result == expected
+    assert result.utcoffset().total_seconds() == 0
+
+
+def test_ttl_cache_evicts_least_recent_over_byte_budget():
+    cache = hrrr._TTLCache(max_size=10, ttl=60)
+    cache.put(("a",), "A", size=4)
+    cache.put(("b",), "B", size=4)
+    assert cache.get(("a",)) == "A"  # "a" is now the most recent entry
+    cache.put(("c",), "C", size=4)
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) == "A"
+    assert cache.get(("c",)) == "C"
+
+
+def test_ttl_cache_skips_values_larger_than_budget():
+    cache = hrrr._TTLCache(max_size=10, ttl=60)
+    cache.put(("a",), "A", size=4)
+    cache.put(("big",), "BIG", size=11)
+    assert cache.get(("big",)) is None
+    assert cache.get(("a",)) == "A"
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(hrrr.time, "monotonic", lambda: clock[0])
+    cache = hrrr._TTLCache(max_size=10, ttl=5)
+    cache.put(("a",), "A", size=6)
+    clock[0] += 4
+    assert cache.get(("a",)) == "A"
+    clock[0] += 2
+    assert cache.get(("a",)) is None
+    # The expired entry no longer counts against the budget.
+    cache.put(("b",), "B", size=10)
+    assert cache.get(("b",)) == "B"
+
+
+def _grid(offset=0.0):
+    lats, lons = np.meshgrid(
+        np.linspace(30.0, 40.0, 20) + offset, np.linspace(-100.0, -90.0, 30), indexing="ij"
+    )
+    return lats, lons
+
+
+def test_grid_tree_reuses_tree_for_same_grid(monkeypatch):
+    monkeypatch.setattr(hrrr, "_GRID_TREES", hrrr.OrderedDict())
+    lats, lons = _grid()
+    tree = hrrr.grid_tree(lats, lons)
+    assert hrrr.grid_tree(lats.copy(), lons.copy()) is tree
+    assert hrrr.grid_tree(*_grid(offset=1.0)) is not tree
+    _dist, idx = tree.query([[lats[3, 7], lons[3, 7]]], k=1)
+    assert idx[0] == 3 * lats.shape[1] + 7
+
+
+def test_grid_tree_builds_once_under_concurrency(monkeypatch):
+    monkeypatch.setattr(hrrr, "_GRID_TREES", hrrr.OrderedDict())
+    builds = []
+    real_tree = hrrr.cKDTree
+
+    def slow_tree(data):
+        builds.append(1)
+        time.sleep(0.05)
+        return real_tree(data)
+
+    monkeypatch.setattr(hrrr, "cKDTree", slow_tree)
+    lats, lons = _grid()
+    trees = []
+    threads = [
+        threading.Thread(target=lambda: trees.append(hrrr.grid_tree(lats, lons)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(builds) == 1
+    assert len(trees) == 8 and all(tree is trees[0] for tree in trees)